@@ -55,7 +55,11 @@ __all__ = [
     "info",
     "warn",
     "error",
+    "error_msg",
+    "error_exc",
     "fatal",
+    "fatal_msg",
+    "fatal_exc",
 
     # full API
     "capture_error",
@@ -79,6 +83,17 @@ _client: Optional[LogfixClient] = None
 
 logger = logging.getLogger("logfix")
 
+# init() 전 호출 경고는 프로세스당 1회만 출력 (루프 내 호출 시 로그 폭주 방지)
+_warned_uninit: bool = False
+
+
+def _warn_uninit(func_name: str) -> None:
+    global _warned_uninit
+    if _warned_uninit:
+        return
+    _warned_uninit = True
+    logger.warning("LogFix: %s called before init(). Call logfix.init() first.", func_name)
+
 
 # 여기서부터는 기본적인 리셋을 담당합니다
 def init(
@@ -93,6 +108,8 @@ def init(
     overflow_policy: str = "drop_newest",
     debug: bool = False,
     enabled: bool = True,
+    min_level: Level = Level.DEBUG,
+    capture_stacks_for_messages: bool = False,
 ) -> LogfixClient:
     """
     LogFix SDK를 초기화 합니다.
@@ -109,6 +126,8 @@ def init(
     overflow_policy:  큐 오버플로우 정책 (타입: drop_newest / drop_oldest / block)
     debug:            True 시 SDK 내부 로그 출력 여부 (Boolean)
     enabled:          False 시 모든 캡처 무시 (Boolean)
+    min_level:        이 레벨 미만의 이벤트는 생성 전에 버림 (기본값: debug)
+    capture_stacks_for_messages: True 시 capture_message 에도 현재 스택 첨부 (Boolean)
 
     Returns
     -------
@@ -127,6 +146,8 @@ def init(
         overflow_policy=overflow_policy,
         debug=debug,
         enabled=enabled,
+        min_level=min_level,
+        capture_stacks_for_messages=capture_stacks_for_messages,
     )
 
     if debug:
@@ -161,7 +182,7 @@ def capture_error(
     Returns event_id or None
     """
     if _client is None:
-        logger.warning("LogFix: capture_error called before init(). Call logfix.init() first.")
+        _warn_uninit("capture_error")
         return None
     return _client.capture_error(exc, level=level, tags=tags, extra=extra, event_id=event_id)
 
@@ -181,7 +202,7 @@ def capture_message(
     Returns event_id or None
     """
     if _client is None:
-        logger.warning("LogFix: capture_message called before init(). Call logfix.init() first.")
+        _warn_uninit("capture_message")
         return None
     return _client.capture_message(message, level=level, tags=tags, extra=extra, event_id=event_id)
 
@@ -196,7 +217,7 @@ def recover_and_capture(func: Callable[[], Any]) -> Any:
         ```
     """
     if _client is None:
-        logger.warning("LogFix: recover_and_capture called before init().")
+        _warn_uninit("recover_and_capture")
         return func()
     return _client.recover_and_capture(func)
 
@@ -218,7 +239,7 @@ def capture_exceptions(
         ```
     """
     if _client is None:
-        logger.warning("LogFix: capture_exceptions called before init().")
+        _warn_uninit("capture_exceptions")
         # return to dummy context
         from contextlib import nullcontext
         return nullcontext()
@@ -261,20 +282,40 @@ def warn(message: str, **kwargs) -> Optional[str]:
     """logfix.warn('msg')  →  Level.WARNING"""
     return capture_message(message, level=Level.WARNING, **kwargs)
 
+def error_msg(message: str, **kwargs) -> Optional[str]:
+    """logfix.error_msg('msg')  →  Level.ERROR"""
+    return capture_message(message, level=Level.ERROR, **kwargs)
+
+def error_exc(exc: BaseException, **kwargs) -> Optional[str]:
+    """logfix.error_exc(exc)  →  Level.ERROR"""
+    return capture_error(exc, level=Level.ERROR, **kwargs)
+
 def error(exc_or_message, **kwargs) -> Optional[str]:
     """
     logfix.error(exc)        ... 예외 캡쳐
     logfix.error('message')  ... 문자열 캡쳐
+
+    인자 타입을 알고 있다면 error_exc / error_msg 를 직접 호출하세요
     """
     if isinstance(exc_or_message, BaseException):
-        return capture_error(exc_or_message, level=Level.ERROR, **kwargs)
-    return capture_message(str(exc_or_message), level=Level.ERROR, **kwargs)
+        return error_exc(exc_or_message, **kwargs)
+    return error_msg(str(exc_or_message), **kwargs)
+
+def fatal_msg(message: str, **kwargs) -> Optional[str]:
+    """logfix.fatal_msg('msg')  →  Level.FATAL"""
+    return capture_message(message, level=Level.FATAL, **kwargs)
+
+def fatal_exc(exc: BaseException, **kwargs) -> Optional[str]:
+    """logfix.fatal_exc(exc)  →  Level.FATAL"""
+    return capture_error(exc, level=Level.FATAL, **kwargs)
 
 def fatal(exc_or_message, **kwargs) -> Optional[str]:
     """
     logfix.fatal(exc)        ... 예외 캡쳐
     logfix.fatal('message')  ... 문자열 캡쳐
+
+    인자 타입을 알고 있다면 fatal_exc / fatal_msg 를 직접 호출하세요
     """
     if isinstance(exc_or_message, BaseException):
-        return capture_error(exc_or_message, level=Level.FATAL, **kwargs)
-    return capture_message(str(exc_or_message), level=Level.FATAL, **kwargs)
\ No newline at end of file
+        return fatal_exc(exc_or_message, **kwargs)
+    return fatal_msg(str(exc_or_message), **kwargs)
\ No newline at end of file
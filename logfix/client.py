@@ -11,12 +11,14 @@ client
 from __future__ import annotations
 
 import logging
+import sys
 from contextlib import contextmanager
-from typing import Any, Callable, Dict, Generator, Optional, TypeVar
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Generator, Optional, Tuple, TypeVar, Union
 
 from .config import Config
-from .context import get_os_info, get_runtime_version, get_stack_trace
-from .event import Event, Level
+from .context import LazyTrace, get_os_info, get_runtime_version, get_stack_trace
+from .event import Event, Level, _fast_uuid4
 from .queue import EventQueue
 from .transport import HttpTransport
 from .worker import BackgroundWorker
@@ -25,6 +27,14 @@ logger = logging.getLogger("logfix.client")
 
 F = TypeVar("F", bound=Callable[..., Any])
 
+# 프로세스 단위 불변 값이므로 import 시 1회만 계산
+# >> intern 하여 모든 이벤트가 같은 문자열 객체를 참조
+_OS_INFO = sys.intern(get_os_info())
+_RUNTIME_VERSION = sys.intern(get_runtime_version())
+
+# tags / extra 미지정 이벤트가 공유하는 빈 매핑 (읽기 전용이라 공유해도 안전)
+_EMPTY: Any = MappingProxyType({})
+
 
 class LogfixClient:
     """
@@ -35,8 +45,10 @@ class LogfixClient:
 
     def __init__(self, config: Config) -> None:
         self._config = config
-        self._os_info = get_os_info()
-        self._runtime_version = get_runtime_version()
+        self._debug = config.debug
+        self._app_version = config.app_version
+        self._min_rank = config.min_level._rank
+        self._capture_stacks = config.capture_stacks_for_messages
         self._started = False
 
         if not config.enabled:
@@ -49,6 +61,7 @@ class LogfixClient:
             maxsize=config.queue_size,
             overflow_policy=config.overflow_policy,
             debug=config.debug,
+            batch_threshold=config.max_batch_size,
         )
         self._transport = HttpTransport(
             api_key=config.api_key,
@@ -102,23 +115,31 @@ class LogfixClient:
         -------
         str | None  성공 시 event_id / 비활성화 상태이면 None
         """
-        if not self._config.enabled or not self._started:
+        # enabled=False 이면 _started 가 True 가 되지 않음
+        if not self._started:
             return None
         try:
-            event = self._build_event(
-                message=self._format_exception(exc),
-                level=level,
-                stack_trace=get_stack_trace(exc),
-                tags=tags,
-                extra=extra,
-                event_id=event_id,
+            # level 검사도 try 안에서 수행 - 잘못된 level 인자로 사용자 코드에 예외를 던지지 않음
+            if level._rank < self._min_rank:
+                return None
+            # 큐가 가득 차 드롭되는 경우 Event 생성 비용을 아끼도록 factory 로 전달
+            # >> 반환할 ID 는 미리 생성
+            event_id = event_id or _fast_uuid4()
+            self._queue.put_lazy(
+                lambda: self._build_event(
+                    message=self._format_exception(exc),
+                    level=level,
+                    stack_trace=get_stack_trace(exc),
+                    tags=tags,
+                    extra=extra,
+                    event_id=event_id,
+                )
             )
-            self._queue.put(event)
-            return event.event_id
+            return event_id
         
         # 예외 Slient 처리
         except Exception as e:
-            if self._config.debug:
+            if self._debug:
                 logger.debug("LogFix: capture_error failed (silent): %s", e)
             return None
 
@@ -139,23 +160,29 @@ class LogfixClient:
         -------
         str | None  성공 시 event_id
         """
-        if not self._config.enabled or not self._started:
+        # enabled=False 이면 _started 가 True 가 되지 않음
+        if not self._started:
             return None
-
         try:
-            event = self._build_event(
-                message=message,
-                level=level,
-                stack_trace=get_stack_trace(),
-                tags=tags,
-                extra=extra,
-                event_id=event_id,
+            if level._rank < self._min_rank:
+                return None
+            # 호출 위치 스택은 이 프레임 기준으로 캡처해야 하므로 factory 밖에서 수집
+            stack_trace = get_stack_trace() if self._capture_stacks else ""
+            event_id = event_id or _fast_uuid4()
+            self._queue.put_lazy(
+                lambda: self._build_event(
+                    message=message,
+                    level=level,
+                    stack_trace=stack_trace,
+                    tags=tags,
+                    extra=extra,
+                    event_id=event_id,
+                )
             )
-            self._queue.put(event)
-            return event.event_id
+            return event_id
 
         except Exception as e:
-            if self._config.debug:
+            if self._debug:
                 logger.debug("LogFix: capture_message failed (silent): %s", e)
             return None
 
@@ -221,27 +248,26 @@ class LogfixClient:
     # Internal
     def _build_event(
         self,
-        message: str,
+        message: Union[str, Tuple[str, BaseException]],
         level: Level,
-        stack_trace: str,
+        stack_trace: Union[str, LazyTrace],
         tags: Optional[Dict[str, str]],
         extra: Optional[Dict[str, Any]],
         event_id: Optional[str],
     ) -> Event:
-        kwargs: Dict[str, Any] = dict(
-            message=message,
-            level=level,
-            os_info=self._os_info,
-            runtime_version=self._runtime_version,
-            app_version=self._config.app_version,
+        return Event.acquire(
+            message,
+            level,
+            os_info=_OS_INFO,
+            runtime_version=_RUNTIME_VERSION,
+            app_version=self._app_version,
             stack_trace=stack_trace,
-            tags=tags or {},
-            extra=extra or {},
+            tags=tags if tags else _EMPTY,
+            extra=extra if extra else _EMPTY,
+            event_id=event_id,
         )
-        if event_id:
-            kwargs["event_id"] = event_id
-        return Event(**kwargs)
 
     @staticmethod
-    def _format_exception(exc: BaseException) -> str:
-        return f"{type(exc).__name__}: {exc}"
\ No newline at end of file
+    def _format_exception(exc: BaseException) -> Tuple[str, BaseException]:
+        # str(exc) 는 임의의 사용자 코드이므로 워커의 Event.to_dict() 에서 포맷
+        return (type(exc).__name__, exc)
\ No newline at end of file
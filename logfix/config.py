@@ -16,6 +16,8 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import Optional
 
+from .event import Level
+
 
 # 오버플로우 정책
 class OverflowPolicy(str, Enum):
@@ -34,7 +36,7 @@ DEFAULT_MAX_RETRIES = 3
 # ============================================
 
 
-@dataclass
+@dataclass(frozen=True)
 class Config:
     """
     LogFix SDK를 초기화 합니다.
@@ -51,6 +53,8 @@ class Config:
     overflow_policy:  큐 오버플로우 정책 (타입: drop_newest / drop_oldest / block)
     debug:            True 시 SDK 내부 로그 출력 여부 (Boolean)
     enabled:          False 시 모든 캡처 무시 (Boolean)
+    min_level:        이 레벨 미만의 이벤트는 생성 전에 버림 (기본값: debug)
+    capture_stacks_for_messages: True 시 capture_message 에도 현재 스택 첨부 (Boolean)
     """
 
     api_key: str
@@ -63,6 +67,8 @@ class Config:
     overflow_policy: OverflowPolicy = OverflowPolicy.DROP_NEWEST
     debug: bool = False
     enabled: bool = True
+    min_level: Level = Level.DEBUG
+    capture_stacks_for_messages: bool = False
 
     def __post_init__(self) -> None:
         self._validate()
@@ -94,7 +100,8 @@ class Config:
 
 
         # endpoint 후행 슬래시 정규화
-        self.endpoint = self.endpoint.rstrip("/")
+        # >> frozen dataclass 이므로 정규화 값은 object.__setattr__ 로 기록
+        object.__setattr__(self, "endpoint", self.endpoint.rstrip("/"))
 
         # endpoint 의 startswitch
         if not self.endpoint.startswith(("http://", "https://")):
@@ -103,9 +110,19 @@ class Config:
         # overflow_policy 문자열 -> Enum 변환 허용
         if isinstance(self.overflow_policy, str):
             try:
-                self.overflow_policy = OverflowPolicy(self.overflow_policy)
+                object.__setattr__(self, "overflow_policy", OverflowPolicy(self.overflow_policy))
             except ValueError:
                 valid = [p.value for p in OverflowPolicy]
                 raise ValueError(
                     f"LogFix: overflow_policy must be one of {valid}, got '{self.overflow_policy}'."
+                )
+
+        # min_level 문자열 -> Enum 변환 허용
+        if not isinstance(self.min_level, Level):
+            try:
+                object.__setattr__(self, "min_level", Level(str(self.min_level).lower()))
+            except ValueError:
+                valid = [lv.value for lv in Level]
+                raise ValueError(
+                    f"LogFix: min_level must be one of {valid}, got '{self.min_level}'."
                 )
\ No newline at end of file
@@ -10,12 +10,15 @@ context
 
 from __future__ import annotations
 
+import functools
 import platform
+import re
 import sys
 import traceback
-from typing import Optional
+from typing import Optional, Union
 
 # ===================================================================================
+@functools.lru_cache(maxsize=1)
 def get_os_info() -> str:
     """
     OS 및 버전 정보 서버 반환
@@ -49,27 +52,29 @@ def get_os_info() -> str:
         return "unknown"
 
 # OS 릴리즈 파서
+_OS_RELEASE_ID = re.compile(r'^ID=["\']?([^"\'\n]+)', re.M)
+_OS_RELEASE_VERSION_ID = re.compile(r'^VERSION_ID=["\']?([^"\'\n]+)', re.M)
+
+
 def _parse_os_release() -> Optional[str]:
     """
     Linux /etc/os-release 파싱
     """
-    info: dict = {}
     try:
         with open("/etc/os-release") as f:
-            for line in f:
-                line = line.strip()
-                if "=" in line:
-                    k, v = line.split("=", 1)
-                    info[k] = v.strip('"')
+            data = f.read()
     except FileNotFoundError:
         return None
 
-    name = info.get("ID", "linux").lower()
-    version = info.get("VERSION_ID", "")
+    m_id = _OS_RELEASE_ID.search(data)
+    m_version = _OS_RELEASE_VERSION_ID.search(data)
+    name = m_id.group(1).strip().lower() if m_id else "linux"
+    version = m_version.group(1).strip() if m_version else ""
     return f"linux-{name}-{version}" if version else f"linux-{name}"
 # ===================================================================================
 
 # Python runtime
+@functools.lru_cache(maxsize=1)
 def get_runtime_version() -> str:
     """
     Python 런타임 버전 반환
@@ -81,17 +86,54 @@ def get_runtime_version() -> str:
         return "python-unknown"  # 아마... 가능성은 별로 없을듯 SDK 오류 방지용
 
 
-def get_stack_trace(exc: Optional[BaseException] = None) -> str:
+class LazyTrace:
+    """
+    지연 렌더링 스택트레이스
+    캡처 시점에는 참조만 보관하고 문자열 변환은 워커 스레드의 Event.to_dict() 에서 수행
+    """
+
+    __slots__ = ("_exc", "_tb", "_stack", "_text")
+
+    def __init__(
+        self,
+        exc: Optional[BaseException] = None,
+        stack: Optional[traceback.StackSummary] = None,
+    ) -> None:
+        self._exc = exc
+        # 재-raise 시 __traceback__ 가 바뀌므로 캡처 시점의 tb 를 고정
+        self._tb = exc.__traceback__ if exc is not None else None
+        self._stack = stack
+        self._text: Optional[str] = None
+
+    def render(self) -> str:
+        if self._text is None:
+            try:
+                if self._exc is not None:
+                    tb_lines = traceback.format_exception(type(self._exc), self._exc, self._tb)
+                else:
+                    tb_lines = self._stack.format()
+                self._text = "".join(tb_lines).strip()
+            except Exception:
+                self._text = ""
+            # 렌더링 후 프레임 참조 해제
+            self._exc = self._tb = self._stack = None
+        return self._text
+
+
+def get_stack_trace(exc: Optional[BaseException] = None) -> Union[str, LazyTrace]:
     """
-    예외 객체로부터 스택트레이스 문자열 반환
+    예외 객체로부터 스택트레이스(LazyTrace) 반환
     exc 가 None 일 경우에는 현재 실행 컨텍스트의 스택이 반환됩니다
     """
     try:
         if exc is not None:
-            tb_lines = traceback.format_exception(type(exc), exc, exc.__traceback__)
-        else:
-            # 현재 스택 캡쳐
-            tb_lines = traceback.format_stack()
-        return "".join(tb_lines).strip()
+            return LazyTrace(exc)
+
+        # 현재 스택 캡쳐 - 프레임 위치만 기록하고 소스 라인 조회는 렌더링 시점으로 미룸
+        stack = traceback.StackSummary.extract(
+            traceback.walk_stack(sys._getframe(1)), lookup_lines=False
+        )
+        stack.reverse()
+        return LazyTrace(stack=stack)
     except Exception:
-        return ""
\ No newline at end of file
+        return ""
@@ -10,12 +10,14 @@ event
 
 from __future__ import annotations
 
+import os
+import threading
 import time
-import uuid
-from datetime import datetime, timezone
-from dataclasses import dataclass, field
+from collections import deque
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, ClassVar, Deque, Dict, List, Optional, Tuple, Union
+
+from .context import LazyTrace
 
 
 # LEVEL (Enum)
@@ -27,8 +29,73 @@ class Level(str, Enum):
     FATAL = "fatal"
 
 
+# 직렬화용 대문자 레벨 문자열 / min_level 비교용 순위 미리 계산
+for _rank, _lv in enumerate(Level):
+    _lv._upper = _lv.value.upper()
+    _lv._rank = _rank
+del _rank, _lv
+
+
+# 타임스탬프 캐시 (초 단위 정밀도이므로 같은 초의 이벤트는 문자열을 재사용)
+# >> (sec, formatted) 튜플 하나로 교체하여 스레드 간 경합에도 짝이 어긋나지 않음
+_ts_cache = (0, "")
+
+
+def _utc_timestamp() -> str:
+    """
+    현재 UTC 시각을 ISO 8601 문자열로 반환
+    """
+    global _ts_cache
+    t = int(time.time())
+    cached = _ts_cache
+    if t != cached[0]:
+        cached = (t, time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(t)))
+        _ts_cache = cached
+    return cached[1]
+
+
+# UUID v4 용 난수 풀 (os.urandom 호출을 256 개 ID 단위로 묶음)
+_RAND_POOL_SIZE = 16 * 256
+_rand_pool = b""
+_rand_idx = _RAND_POOL_SIZE
+_rand_lock = threading.Lock()
+
+
+def _reset_rand_pool() -> None:
+    # fork 이후 자식 프로세스가 부모와 같은 풀을 쓰면 ID 가 중복됨
+    # >> 부모의 다른 스레드가 락을 쥔 채 fork 되면 자식에서 영영 풀리지 않으므로 락도 새로 만듦
+    global _rand_idx, _rand_lock
+    _rand_lock = threading.Lock()
+    _rand_idx = _RAND_POOL_SIZE
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_rand_pool)
+
+
+def _fast_uuid4() -> str:
+    """
+    UUID v4 문자열 반환 (uuid.UUID 객체 생성 없이 직접 포맷)
+    """
+    global _rand_pool, _rand_idx
+    with _rand_lock:
+        if _rand_idx >= _RAND_POOL_SIZE:
+            _rand_pool = os.urandom(_RAND_POOL_SIZE)
+            _rand_idx = 0
+        b = bytearray(_rand_pool[_rand_idx:_rand_idx + 16])
+        _rand_idx += 16
+
+    b[6] = (b[6] & 0x0F) | 0x40  # version 4
+    b[8] = (b[8] & 0x3F) | 0x80  # RFC 4122 variant
+    h = b.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+# 재사용 가능한 Event free-list 최대 크기
+_EVENT_POOL_SIZE = 256
+
+
 
-@dataclass
 class Event:
     """
     LogFix 이벤트 단위
@@ -38,52 +105,160 @@ class Event:
     사용자가 직접 override 하려면 event_id 를 명시적으로 전달하세요
     """
 
-    message: str
-    level: Level = Level.ERROR
-    timestamp: str = field(
-        default_factory=lambda: datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    # 캡처마다 생성되는 객체이므로 __dict__ 없이 고정 슬롯 사용
+    __slots__ = (
+        "message",
+        "level",
+        "timestamp",
+        "event_id",
+        # 자동 수집 컨텍스트
+        "os_info",
+        "runtime_version",
+        "app_version",
+        "stack_trace",
+        # 사용자 정의
+        "tags",
+        "extra",
+        # HTTP 컨텍스트
+        "http_method",
+        "http_url",
+        "http_status_code",
     )
-    event_id: str = field(default_factory=lambda: str(uuid.uuid4()))
 
-    # 자동 수집 컨텍스트
-    os_info: str = ""
-    runtime_version: str = ""
-    app_version: str = "unknown"
-    stack_trace: str = ""
+    # 전송이 끝난 Event 를 재사용하는 free-list (deque append/pop 은 GIL 하에서 원자적)
+    _pool: ClassVar[Deque[Event]] = deque(maxlen=_EVENT_POOL_SIZE)
+
+    def __init__(
+        self,
+        message: Union[str, Tuple[str, BaseException]],
+        level: Level = Level.ERROR,
+        timestamp: Optional[str] = None,
+        event_id: Optional[str] = None,
+        os_info: str = "",
+        runtime_version: str = "",
+        app_version: str = "unknown",
+        stack_trace: Union[str, LazyTrace] = "",
+        tags: Optional[Dict[str, str]] = None,
+        extra: Optional[Dict[str, Any]] = None,
+        http_method: Optional[str] = None,
+        http_url: Optional[str] = None,
+        http_status_code: Optional[int] = None,
+    ) -> None:
+        self.message = message
+        self.level = level
+        self.timestamp = timestamp or _utc_timestamp()
+        self.event_id = event_id or _fast_uuid4()
+        self.os_info = os_info
+        self.runtime_version = runtime_version
+        self.app_version = app_version
+        self.stack_trace = stack_trace
+        self.tags = tags if tags is not None else {}
+        self.extra = extra if extra is not None else {}
+        self.http_method = http_method
+        self.http_url = http_url
+        self.http_status_code = http_status_code
 
-    # 사용자 정의
-    tags: Dict[str, str] = field(default_factory=dict)
-    extra: Dict[str, Any] = field(default_factory=dict)
+    @classmethod
+    def acquire(cls, *args: Any, **kwargs: Any) -> Event:
+        """
+        풀에서 Event 를 꺼내 초기화하여 반환 (풀이 비어 있으면 새로 생성)
+        """
+        try:
+            event = cls._pool.pop()
+        except IndexError:
+            return cls(*args, **kwargs)
+        event.__init__(*args, **kwargs)
+        return event
 
-    # HTTP 컨텍스트
-    http_method: Optional[str] = None
-    http_url: Optional[str] = None
-    http_status_code: Optional[int] = None
+    def release(self) -> None:
+        """
+        전송/드롭이 끝난 Event 의 참조를 해제하고 풀에 반환
+        반환 이후에는 이 객체를 사용하면 안 됩니다
+        """
+        self.message = ""
+        self.stack_trace = ""
+        self.tags = None
+        self.extra = None
+        self.http_method = None
+        self.http_url = None
+        self._pool.append(self)
+
+    def __repr__(self) -> str:
+        return f"Event(event_id={self.event_id!r}, level={self.level!r}, message={self.message!r})"
 
     def to_dict(self) -> Dict[str, Any]:
-        payload: Dict[str, Any] = {
-            "id": self.event_id,
-            "timestamp": self.timestamp,
-            "level": self.level.value.upper(),
-            "message": self.message,
-            "app_version": self.app_version,
-        }
+        # 지연 메시지 / 스택트레이스는 직렬화 시점(워커 스레드)에 렌더링
+        # >> 같은 슬롯을 여러 번 읽는 필드는 지역 변수로 바인딩
+        message = self.message
+        if type(message) is tuple:
+            self.message = _render_exception_message(*message)
+        stack_trace = self.stack_trace
+        if type(stack_trace) is LazyTrace:
+            stack_trace = self.stack_trace = stack_trace.render()
 
+        # 채워진 선택 필드 조합(shape)별로 특화된 직렬화 함수 사용
+        shape = 0
         if self.os_info:
-            payload["os_version"] = self.os_info
+            shape |= 1
         if self.runtime_version:
-            payload["platform"] = self.runtime_version
-        if self.stack_trace:
-            payload["stacktrace"] = self.stack_trace
+            shape |= 2
+        if stack_trace:
+            shape |= 4
         if self.tags:
-            payload["tags"] = self.tags
+            shape |= 8
         if self.extra:
-            payload["extra"] = self.extra
+            shape |= 16
         if self.http_method is not None:
-            payload["http"] = {
-                "method": self.http_method,
-                "url": self.http_url,
-                "status_code": self.http_status_code,
-            }
+            shape |= 32
+
+        serializer = _SERIALIZERS.get(shape)
+        if serializer is None:
+            serializer = _SERIALIZERS[shape] = _compile_serializer(shape)
+        return serializer(self)
+
+
+def _render_exception_message(type_name: str, exc: BaseException) -> str:
+    """
+    (예외 타입명, 예외) -> "TypeName: message"
+    str(exc) 는 사용자 코드이므로 실패해도 이벤트는 전송
+    """
+    try:
+        return f"{type_name}: {exc}"
+    except Exception:
+        return f"{type_name}: <unprintable exception>"
+
+
+# 직렬화 함수 생성기
+# >> shape 비트 순서와 payload 키 순서가 동일해야 합니다
+_REQUIRED_FIELDS = (
+    ("id", "e.event_id"),
+    ("timestamp", "e.timestamp"),
+    ("level", "e.level._upper"),
+    ("message", "e.message"),
+    ("app_version", "e.app_version"),
+)
+_OPTIONAL_FIELDS = (
+    ("os_version", "e.os_info"),
+    ("platform", "e.runtime_version"),
+    ("stacktrace", "e.stack_trace"),
+    ("tags", "e.tags"),
+    ("extra", "e.extra"),
+    ("http", '{"method": e.http_method, "url": e.http_url, "status_code": e.http_status_code}'),
+)
+_SERIALIZERS: Dict[int, Callable[[Event], Dict[str, Any]]] = {}
+
+
+def _compile_serializer(shape: int) -> Callable[[Event], Dict[str, Any]]:
+    """
+    주어진 shape 의 payload 를 dict 리터럴 하나로 만드는 함수를 생성
+    처음 등장한 shape 에 대해서만 1회 컴파일됩니다
+    """
+    fields = list(_REQUIRED_FIELDS)
+    for bit, item in enumerate(_OPTIONAL_FIELDS):
+        if shape & (1 << bit):
+            fields.append(item)
 
-        return payload
\ No newline at end of file
+    body = ", ".join(f'"{key}": {expr}' for key, expr in fields)
+    namespace: Dict[str, Any] = {}
+    exec(f"def _serialize(e):\n    return {{{body}}}\n", namespace)
+    return namespace["_serialize"]
@@ -10,10 +10,11 @@ queue
 
 from __future__ import annotations
 
+import itertools
 import logging
-import queue
 import threading
-from typing import List
+from collections import deque
+from typing import Callable, Deque, List, Optional
 
 from .config import OverflowPolicy
 from .event import Event
@@ -23,7 +24,7 @@ logger = logging.getLogger("logfix.queue")
 
 class EventQueue:
     """
-    thread safety event queue
+    thread safety event queue (MPSC - 다수 생산자 / 단일 소비자 워커)
 
     overflow policy:
       - DROP_NEWEST: 큐가 가득 차면 새 이벤트를 버림
@@ -36,14 +37,44 @@ class EventQueue:
         maxsize: int,
         overflow_policy: OverflowPolicy,
         debug: bool = False,
+        batch_threshold: Optional[int] = None,
+        batch_ready_callback: Optional[Callable[[], None]] = None,
     ) -> None:
-        self._q: queue.Queue[Event] = queue.Queue(maxsize=maxsize)
+        self._maxsize = maxsize
+        # 큐 길이가 이 값에 도달하면 batch_ready_callback 호출 (소비자 폴링 불필요)
+        self._batch_threshold = batch_threshold if batch_threshold is not None else maxsize
+        self._batch_ready_callback = batch_ready_callback
+        # edge-trigger 플래그 - 임계값 도달 후 drain 전까지는 콜백을 다시 부르지 않음
+        self._batch_signalled = False
         self._policy = overflow_policy
         self._debug = debug
-        self._dropped_count = 0
-
-        # > RLock 으로 교체 >> DROP_OLDEST 루프 내부에서 _on_drop을 호출할 때 같은 스레드가 재진입하므로 일반 Lock 사용 시 데드락이 발생
-        self._lock = threading.RLock()
+        # 드롭 집계 - next() 는 GIL 하의 단일 C 호출이라 쓰기(핫 경로)에 락 불필요
+        self._drop_counter = itertools.count()
+        self._drop_reads = 0  # dropped_count 조회 시 소비한 카운터 값의 수
+
+        # 저장소
+        # >> DROP_NEWEST: 락 없이 append 하는 deque (기본 정책 - 핫 경로 최우선)
+        # >> DROP_OLDEST / BLOCK: 어차피 락을 잡으므로 미리 할당한 list 링 버퍼의 슬롯을 재사용
+        # >> (deque 처럼 64 칸 블록을 할당/해제하지 않고, 메모리가 maxsize 슬롯으로 고정)
+        self._dq: Optional[Deque[Event]] = None
+        if overflow_policy == OverflowPolicy.DROP_NEWEST:
+            self._dq = deque()
+        self._buf: List[Optional[Event]] = [] if self._dq is not None else [None] * maxsize
+        self._head = 0  # 가장 오래된 이벤트 위치
+        self._tail = 0  # 다음 삽입 위치
+        self._count = 0
+
+        # > _on_drop 이 락 밖에서 호출되어 재진입이 없으므로 RLock 대신 일반 Lock 사용
+        self._lock = threading.Lock()
+
+        # BLOCK 정책 전용 - drain 으로 공간이 생기면 대기 중인 생산자를 깨움
+        self._not_full = threading.Condition(self._lock)
+
+    def set_batch_ready_callback(self, callback: Optional[Callable[[], None]]) -> None:
+        """
+        배치 준비(큐 길이 >= batch_threshold) 시 호출할 콜백을 등록합니다
+        """
+        self._batch_ready_callback = callback
 
     def put(self, event: Event) -> bool:
         """
@@ -52,30 +83,49 @@ class EventQueue:
         """
         try:
             if self._policy == OverflowPolicy.DROP_NEWEST:
-                try:
-                    self._q.put_nowait(event)
-                    return True
-                except queue.Full:
+                # len / append 는 각각 GIL 하에서 원자적이므로 락 없이 처리
+                # >> 동시 생산자 수만큼 maxsize 를 잠깐 넘을 수 있음 (soft limit)
+                if len(self._dq) >= self._maxsize:
                     self._on_drop(event, reason="queue full (drop_newest)")
                     return False
+                self._dq.append(event)
+                if len(self._dq) >= self._batch_threshold and not self._batch_signalled:
+                    self._signal_batch_ready()
+                return True
 
             elif self._policy == OverflowPolicy.DROP_OLDEST:
-                # RLock으로 감싸 경쟁 조건 방지.
+                # drain 과 같은 락으로 감싸 밀려나는 이벤트를 정확히 집계
+                # >> 집계/로그(_on_drop)는 락 밖에서 처리
+                dropped = None
                 with self._lock:
-                    while True:
-                        try:
-                            self._q.put_nowait(event)
-                            return True
-                        except queue.Full:
-                            try:
-                                dropped = self._q.get_nowait()
-                                self._on_drop(dropped, reason="queue full (drop_oldest)")
-                            except queue.Empty:
-                                pass
+                    tail = self._tail
+                    if self._count == self._maxsize:
+                        # 가득 참 -> head == tail 이므로 가장 오래된 슬롯을 덮어쓰고 head 도 전진
+                        dropped = self._buf[tail]
+                        self._head = tail + 1 if tail + 1 < self._maxsize else 0
+                    else:
+                        self._count += 1
+                    self._buf[tail] = event
+                    self._tail = tail + 1 if tail + 1 < self._maxsize else 0
+                    count = self._count
+                if dropped is not None:
+                    self._on_drop(dropped, reason="queue full (drop_oldest)")
+                if count >= self._batch_threshold and not self._batch_signalled:
+                    self._signal_batch_ready()
+                return True
 
             elif self._policy == OverflowPolicy.BLOCK:
                 # 성능 영향의 우려로 가능하면 사용하지 마세요
-                self._q.put(event)
+                with self._not_full:
+                    while self._count >= self._maxsize:
+                        self._not_full.wait()
+                    tail = self._tail
+                    self._buf[tail] = event
+                    self._tail = tail + 1 if tail + 1 < self._maxsize else 0
+                    self._count += 1
+                    ready = self._count >= self._batch_threshold and not self._batch_signalled
+                if ready:
+                    self._signal_batch_ready()
                 return True
 
         except Exception as e:
@@ -84,41 +134,108 @@ class EventQueue:
 
         return False
 
+    def put_lazy(self, factory: Callable[[], Event]) -> bool:
+        """
+        공간이 확인된 뒤에만 factory() 로 이벤트를 생성해 삽입합니다.
+        Returns True if enqueued, False if dropped.
+
+        DROP_NEWEST 에서 큐가 가득 차 있으면 이벤트를 만들지 않고 드롭만 집계
+        >> DROP_OLDEST / BLOCK 은 새 이벤트가 항상 들어가므로 바로 생성해 put()
+        """
+        try:
+            if self._policy == OverflowPolicy.DROP_NEWEST:
+                if len(self._dq) >= self._maxsize:
+                    self._on_drop(None, reason="queue full (drop_newest)")
+                    return False
+                self._dq.append(factory())
+                if len(self._dq) >= self._batch_threshold and not self._batch_signalled:
+                    self._signal_batch_ready()
+                return True
+
+            return self.put(factory())
+
+        except Exception as e:
+            if self._debug:
+                logger.debug("EventQueue.put_lazy failed: %s", e)
+
+        return False
+
     def drain(self, max_items: int) -> List[Event]:
         """
         최대 max_items 개의 이벤트를 꺼내 반환
         """
-        items: List[Event] = []
-        for _ in range(max_items):
-            try:
-                items.append(self._q.get_nowait())
-            except queue.Empty:
-                break
+        with self._lock:
+            if self._dq is not None:
+                popleft = self._dq.popleft
+                n = min(max_items, len(self._dq))
+                items = [popleft() for _ in range(n)]
+            else:
+                n = min(max_items, self._count)
+                items = self._take_from_ring(n)
+            self._batch_signalled = False  # 다음 임계값 도달 시 다시 콜백
+            if n and self._policy == OverflowPolicy.BLOCK:
+                self._not_full.notify(n)
         return items
 
     def drain_all(self) -> List[Event]:
-        # maxsize=0 의 위험성 보고로 > 0 변동
-        limit = self._q.maxsize if self._q.maxsize > 0 else self._q.qsize()
-        return self.drain(max(limit, 1))
+        # deque 교체(swap) 방식은 락 없이 append 하는 DROP_NEWEST 생산자가
+        # 교체 직전의 deque 에 넣은 이벤트를 잃을 수 있어 popleft 방식을 유지
+        return self.drain(self.size())
 
     def size(self) -> int:
-        return self._q.qsize()
+        return len(self._dq) if self._dq is not None else self._count
 
     def is_empty(self) -> bool:
-        return self._q.empty()
+        return not self._dq if self._dq is not None else not self._count
 
     @property
     def dropped_count(self) -> int:
-        return self._dropped_count
-
-    def _on_drop(self, event: Event, reason: str) -> None:
-        # Lock 에서 RLock 으로 변경
+        # 조회(드묾)에서만 락 사용 - 조회마다 카운터 값 1 개를 소비하므로 그만큼 보정
         with self._lock:
-            self._dropped_count += 1
+            value = next(self._drop_counter) - self._drop_reads
+            self._drop_reads += 1
+        return value
+
+    def _take_from_ring(self, n: int) -> List[Event]:
+        # 호출자가 self._lock 을 보유한 상태에서 호출
+        # >> 슬라이스로 한 번에 복사하고 비운 슬롯은 None 으로 되돌려 참조를 끊음
+        if not n:
+            return []
+        buf = self._buf
+        size = self._maxsize
+        head = self._head
+        end = head + n
+        if end <= size:
+            items = buf[head:end]
+            buf[head:end] = [None] * n
+        else:
+            end -= size
+            items = buf[head:] + buf[:end]
+            buf[head:] = [None] * (size - head)
+            buf[:end] = [None] * end
+        self._head = end if end < size else 0
+        self._count -= n
+        return items  # type: ignore[return-value]
+
+    def _signal_batch_ready(self) -> None:
+        # 동시 생산자끼리 경합하면 콜백이 두 번 불릴 수 있으나 무해 (워커 깨우기 등 멱등 콜백 전제)
+        self._batch_signalled = True
+        callback = self._batch_ready_callback
+        if callback is not None:
+            callback()
+
+    def _on_drop(self, event: Optional[Event], reason: str) -> None:
+        # event 가 None 이면 put_lazy 에서 생성 전에 드롭된 경우
+        next(self._drop_counter)
+        if event is None:
+            if self._debug:
+                logger.debug("LogFix: event dropped before creation reason=%s", reason)
+            return
         if self._debug:
             logger.debug(
                 "LogFix: event dropped [%s] reason=%s event_id=%s",
                 event.level,
                 reason,
                 event.event_id,
-            )
\ No newline at end of file
+            )
+        event.release()
\ No newline at end of file
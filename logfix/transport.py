@@ -8,19 +8,27 @@ transport
 
 from __future__ import annotations
 
+import gzip
 import json
 import logging
 import math
+import random
 import time
-from typing import List, Optional, Tuple
+from datetime import timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, List, Optional, Tuple
 
 try:
-    import requests
-    from requests.adapters import HTTPAdapter
-    from requests.exceptions import RequestException
-    _HAS_REQUESTS = True
+    import urllib3
+    _HAS_URLLIB3 = True
 except ImportError:
-    _HAS_REQUESTS = False
+    _HAS_URLLIB3 = False
+
+try:
+    import orjson  # type: ignore  # optional dependency
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
 
 from .event import Event
 
@@ -30,6 +38,112 @@ logger = logging.getLogger("logfix.transport")
 # PATH
 _INGEST_PATH = "/v1/ingest"
 _DEFAULT_TIMEOUT = 10
+_WARMUP_TIMEOUT = 2  # 워밍업은 best-effort - 연결이 늦으면 바로 포기
+_GZIP_HEADERS = {"Content-Encoding": "gzip"}
+_GZIP_MIN_BYTES = 1024  # 이보다 작은 payload 는 압축 이득보다 CPU 비용이 큼
+
+# Event.to_dict 를 모듈 수준에 바인딩 (map 으로 직접 호출)
+_event_to_dict = Event.to_dict
+
+
+def _dumps(payload: dict) -> bytes:
+    """
+    배치 payload 를 JSON bytes 로 직렬화
+    orjson 이 설치되어 있으면 사용하고, 없으면 표준 json 으로 대체
+    """
+    if _HAS_ORJSON:
+        try:
+            return orjson.dumps(payload, default=str, option=orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            pass  # 64bit 초과 정수 등 orjson 미지원 값 -> 표준 json 으로 재시도
+    return json.dumps(payload, default=str).encode("utf-8")
+
+
+# urllib3 Retry 가 재시도하는 응답 코드
+_RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+# 서버가 지정한 재시도 대기 시간 상한 (seconds) - 응답 코드와 무관하게 적용
+_MAX_RETRY_WAIT = 60.0
+
+
+def _rate_limit_wait(headers: "urllib3.HTTPHeaderDict") -> float:
+    """
+    Rate limit 헤더를 읽어 대기 시간을 계산 (1~60초로 제한)
+    우선순위: Retry-After (초 또는 HTTP-date) > X-RateLimit-Reset (Unix timestamp)
+    헤더가 없으면 기본 대기 시간을 반환
+    """
+    # Retry-After header (RFC 7231 - delay-seconds / HTTP-date)
+    try:
+        retry_after = headers.get("Retry-After")
+        if retry_after:
+            try:
+                wait = float(retry_after)
+            except ValueError:
+                retry_at = parsedate_to_datetime(retry_after)
+                if retry_at.tzinfo is None:
+                    retry_at = retry_at.replace(tzinfo=timezone.utc)
+                wait = retry_at.timestamp() - time.time()
+            return max(1.0, min(wait, _MAX_RETRY_WAIT))
+    except Exception:
+        pass
+
+    try:
+        reset_at = headers.get("X-RateLimit-Reset") # Unix timestamp
+        if reset_at:
+            wait = float(reset_at) - time.time()
+            return max(1.0, min(wait, _MAX_RETRY_WAIT))
+    except Exception:
+        pass
+
+    return 5.0 # default delay
+
+
+if _HAS_URLLIB3:
+
+    class _LogFixRetry(urllib3.util.Retry):
+        """
+        urllib3 Retry 확장 - 재시도 루프는 urllib3 가 수행
+
+          - 백오프: full jitter, [0, min(backoff_cap, backoff_factor * 2^n)] 구간에서 균등 랜덤
+          - 429: Retry-After / X-RateLimit-Reset 헤더 기반 대기 (1~60초)
+          - 그 외 (503 / 413 등): Retry-After 를 따르되 60초로 제한
+        """
+
+        def __init__(
+            self,
+            *args: Any,
+            backoff_cap: float = 30.0,
+            rng: Optional[random.Random] = None,
+            **kwargs: Any,
+        ) -> None:
+            super().__init__(*args, **kwargs)
+            self.backoff_cap = backoff_cap
+            # 전송기(HttpTransport)별 난수원 - 미지정 시 새 SystemRandom
+            self._rng = rng if rng is not None else random.SystemRandom()
+
+        def new(self, **kw: Any) -> "_LogFixRetry":
+            # urllib3 는 시도마다 new() 로 복사본을 만들므로 확장 속성을 이어 붙임
+            kw.setdefault("backoff_cap", self.backoff_cap)
+            kw.setdefault("rng", self._rng)
+            return super().new(**kw)
+
+        def get_backoff_time(self) -> float:
+            # history 길이 = 지금까지 실패한 시도 수 -> 첫 재시도는 0~base 초
+            attempt = len(self.history) - 1
+            if attempt < 0:
+                return 0
+            return self._rng.uniform(0, min(self.backoff_cap, self.backoff_factor * 2 ** attempt))
+
+        def get_retry_after(self, response):
+            if response.status == 429:
+                return _rate_limit_wait(response.headers)
+            try:
+                wait = super().get_retry_after(response)
+            except Exception:
+                return None  # 잘못된 헤더 -> 지수 백오프로 대체
+            if wait is None:
+                return None
+            return min(wait, _MAX_RETRY_WAIT)
 
 
 class TransportResult:
@@ -61,9 +175,9 @@ class HttpTransport:
     """
     LogFix Core API 로 배치 이벤트를 전송
 
-    재시도 정책:
-      - 네트워크 오류 또는 5xx -> 지수 백오프 후 재시도 (최대 max_retries회)
-      - 429 (Rate Limit) -> X-RateLimit-Remaining 헤더 기반 대기
+    재시도 정책 (urllib3 Retry 로 커넥션 풀 안에서 처리):
+      - 네트워크 오류 또는 500/502/503/504 -> 지수 백오프(full jitter) 후 재시도 (최대 max_retries회)
+      - 429 (Rate Limit) -> Retry-After / X-RateLimit-Reset 헤더 기반 대기 후 재시도
       - 401 (Auth Error) -> 즉시 포기, 경고 로그 출력
       - 기타 4xx -> 즉시 포기
     """
@@ -74,98 +188,135 @@ class HttpTransport:
         endpoint: str,
         max_retries: int = 3,
         debug: bool = False,
+        backoff_base: float = 1.0,
+        backoff_cap: float = 30.0,
     ) -> None:
-        if not _HAS_REQUESTS:
+        if not _HAS_URLLIB3:
             raise ImportError(
-                "LogFix requires 'requests' package."
-                "Install it with: pip install requests"
+                "LogFix requires 'urllib3' package. "
+                "Install it with: pip install urllib3"
             )
         self._api_key = api_key
         self._endpoint = endpoint.rstrip("/")
         self._max_retries = max_retries
         self._debug = debug
-        self._session = self._build_session()
-
-    def _build_session(self) -> "requests.Session":
-        session = requests.Session()
-        session.headers.update(
-            {
-                "Content-Type": "application/json",
-                "X-API-KEY": self._api_key,
-                "X-LogFix-SDK": "python",
-                "User-Agent": "logfix-python-sdk/1.0.0",
-            }
+        self._backoff_base = backoff_base
+        self._backoff_cap = backoff_cap
+        # 인스턴스 전용 난수원 - os.urandom 기반이라 fork 된 워커 프로세스끼리 jitter 가 겹치지 않음
+        self._rng = random.SystemRandom()
+        self._headers = {
+            "Content-Type": "application/json",
+            "X-API-KEY": self._api_key,
+            "X-LogFix-SDK": "python",
+            "User-Agent": "logfix-python-sdk/1.0.0",
+        }
+        # urllib3 는 요청별 headers 가 기본 헤더를 대체하므로 병합본을 미리 준비
+        self._gzip_headers = {**self._headers, **_GZIP_HEADERS}
+        self._pool = self._build_pool()
+
+        # 전송 경로에서 반복되는 URL 조합 / 속성 조회를 미리 처리
+        # >> body 가 이미 bytes 이므로 request() 의 인코딩 분기 없이 urlopen 을 직접 사용
+        self._ingest_url = f"{self._endpoint}{_INGEST_PATH}"
+        self._urlopen = self._pool.urlopen
+
+    def _build_pool(self) -> "urllib3.PoolManager":
+        # requests 계층 없이 urllib3 로 직접 전송
+        # >> 같은 호스트로만 전송하므로 호스트 풀 1개에 keep-alive 연결을 재사용
+        # >> 재시도 / 백오프 / Retry-After 대기는 urllib3 Retry 가 처리 (POST 도 재시도 허용)
+        retry = _LogFixRetry(
+            total=self._max_retries,
+            redirect=False,
+            backoff_factor=self._backoff_base,
+            status_forcelist=_RETRY_STATUS_CODES,
+            allowed_methods=frozenset({"POST"}),
+            respect_retry_after_header=True,
+            raise_on_status=False,  # 재시도 소진 시 마지막 응답을 그대로 반환
+            backoff_cap=self._backoff_cap,
+            rng=self._rng,
+        )
+        return urllib3.PoolManager(
+            num_pools=1,
+            maxsize=4,
+            block=False,
+            headers=self._headers,
+            retries=retry,
         )
-        return session
 
-    def send_batch(self, events: List[Event]) -> TransportResult:
+    def warmup(self) -> None:
+        """
+        수집 URL 로 HEAD 요청을 보내 TCP / TLS 연결을 미리 맺어 풀에 보관합니다
+        첫 배치 전송에서 핸드셰이크 비용(100~300ms)을 없애기 위함이며 실패는 무시
+        """
+        try:
+            # 워밍업은 재시도 / 리다이렉트 없이 1회만 시도
+            self._urlopen(
+                "HEAD",
+                self._ingest_url,
+                retries=False,
+                redirect=False,
+                timeout=_WARMUP_TIMEOUT,
+            )
+        except Exception as exc:
+            if self._debug:
+                logger.debug("LogFix: connection warmup failed (ignored): %s", exc)
+
+    def send_batch(self, events: List[Event], timeout: Optional[float] = None) -> TransportResult:
         """
         이벤트 배치를 전송
+
+        timeout 을 지정하면 재시도 없이 timeout 초 안에 1 회만 시도 (종료 시 마감 시간 안의 전송용)
         """
         if not events:
             return TransportResult(success=True)
 
-        payload = self._build_payload(events)
-        url = f"{self._endpoint}{_INGEST_PATH}"
-
-        attempt = 0
-        last_result: TransportResult = TransportResult(success=False, error="not attempted")
-
-        while attempt <= self._max_retries:
-            last_result = self._do_request(url, payload)
-
-            if last_result.success:
-                if self._debug:
-                    logger.debug(
-                        "LogFix: batch sent successfully [%d events, attempt %d]",
-                        len(events),
-                        attempt + 1,
-                    )
-                return last_result
-
-            if not last_result.retryable:
-                if self._debug:
-                    logger.debug(
-                        "LogFix: non-retryable failure status=%s error=%s",
-                        last_result.status_code,
-                        last_result.error,
-                    )
-                return last_result
-
-            # 재시도 대기
-            wait_seconds = last_result.retry_after or self._backoff_seconds(attempt)
-            if self._debug:
-                logger.debug(
-                    "LogFix: retrying in %.2fs (attempt %d/%d) status=%s",
-                    wait_seconds,
-                    attempt + 1,
-                    self._max_retries,
-                    last_result.status_code,
-                )
-            time.sleep(wait_seconds)
-            attempt += 1
+        # payload 는 재시도 간 공유되도록 1회만 직렬화/압축
+        try:
+            payload = self._build_payload(events)
+        except Exception as exc:
+            return TransportResult(success=False, retryable=False, error=f"serialization_failed: {exc}")
+
+        # 이벤트 payload 는 반복이 많아 압축률이 높음 -> level 1 로 CPU 비용 최소화
+        headers = self._headers
+        if len(payload) > _GZIP_MIN_BYTES:
+            payload = gzip.compress(payload, compresslevel=1)
+            headers = self._gzip_headers
 
+        # 재시도는 urllib3 Retry 가 수행하므로 결과는 마지막 시도 기준
+        result = self._do_request(payload, headers, timeout)
         if self._debug:
-            logger.debug(
-                "LogFix: batch failed after %d retries, dropping %d events",
-                self._max_retries,
-                len(events),
-            )
-        return last_result
+            if result.success:
+                logger.debug("LogFix: batch sent successfully [%d events]", len(events))
+            else:
+                logger.debug(
+                    "LogFix: batch failed, dropping %d events status=%s error=%s",
+                    len(events),
+                    result.status_code,
+                    result.error,
+                )
+        return result
 
-    def _do_request(self, url: str, payload: dict) -> TransportResult:
+    def _do_request(
+        self,
+        payload: bytes,
+        headers: Dict[str, str],
+        timeout: Optional[float] = None,
+    ) -> TransportResult:
         """
         단일 HTTP 요청을 수행합니다
         예외를 TransportResult로 변환합니다.
         """
         try:
-            response = self._session.post(
-                url,
-                data=json.dumps(payload, default=str),
-                timeout=_DEFAULT_TIMEOUT,
+            # retries=None 이면 풀의 _LogFixRetry 사용, False 면 재시도 / 백오프 / Retry-After 대기 없음
+            response = self._urlopen(
+                "POST",
+                self._ingest_url,
+                body=payload,
+                headers=headers,
+                retries=None if timeout is None else False,
+                timeout=_DEFAULT_TIMEOUT if timeout is None else timeout,
             )
 
-            status = response.status_code
+            status = response.status
 
             if 200 <= status < 300:
                 return TransportResult(success=True, status_code=status)
@@ -184,13 +335,11 @@ class HttpTransport:
                 )
 
             if status == 429:
-                # X-RateLimit-Remaining header 기반 대기
-                retry_after = self._parse_rate_limit_header(response)
+                # 헤더 기반 대기 / 재시도는 _LogFixRetry 가 이미 수행함
                 return TransportResult(
                     success=False,
                     status_code=status,
                     retryable=True,
-                    retry_after=retry_after,
                     error="rate_limit_exceeded",
                 )
 
@@ -216,50 +365,16 @@ class HttpTransport:
                 error=str(exc),
             )
 
-    def _parse_rate_limit_header(self, response: "requests.Response") -> float:
-        """
-        X-RateLimit-Remaining 헤더 값을 읽어 대기 시간을 계산.
-        헤더가 없으면 기본 백오프를 반환
-        """
-        try:
-            remaining = response.headers.get("X-RateLimit-Remaining")
-            reset_at = response.headers.get("X-RateLimit-Reset") # Unix timestamp
-
-            if reset_at:
-                wait = float(reset_at) - time.time()
-                return max(1.0, min(wait, 60.0))
-
-            # Retry-After header
-            retry_after = response.headers.get("Retry-After")
-            if retry_after:
-                return max(1.0, float(retry_after))
-
-        except Exception:
-            pass
-
-        return 5.0 # default delay
-
-    @staticmethod
-    def _backoff_seconds(attempt: int) -> float:
-        """
-        지수 백오프 : base=1s, multiplier=2, jitter 포함
-        attempt=0 -> ~1s, attempt=1 -> ~2s, attempt=2 -> ~4s
-        """
-        import random
-        base = 2 ** attempt
-        jitter = random.uniform(0, base * 0.2)
-        return min(base + jitter, 30.0) # Max : 30s gap
-
-    def _build_payload(self, events: List[Event]) -> dict:
-        return {
-            "events": [e.to_dict() for e in events],
-        }
+    def _build_payload(self, events: List[Event]) -> bytes:
+        # 배치 전체를 dumps 1 회로 직렬화
+        # >> to_dict 를 모듈 수준에 바인딩해 이벤트마다의 메서드 탐색을 생략
+        return _dumps({"events": list(map(_event_to_dict, events))})
 
     def close(self) -> None:
         """
-        세션 리소스를 정리합니다.
+        커넥션 풀 리소스를 정리합니다.
         """
         try:
-            self._session.close()
+            self._pool.clear()
         except Exception:
             pass
\ No newline at end of file
@@ -10,18 +10,47 @@ from __future__ import annotations
 
 import atexit
 import logging
+import os
 import signal
+import socket
 import threading
 import time
-from typing import List, Optional
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import List, Optional, Tuple
 
 from .event import Event
 from .queue import EventQueue
-from .transport import HttpTransport
+from .transport import HttpTransport, TransportResult
 
 logger = logging.getLogger("logfix.worker")
 
 
+# 적응형 배치 크기
+# >> 지연 모델 배치 = min(큐 깊이 EWMA * 전송 RTT EWMA / 목표 지연, max_batch_size)
+# >> 쌓인 이벤트를 목표 지연 안에 비우는 데 필요한 최소 배치 -> 배치를 키우는 데만 사용
+# >> (max_batch_size 이하로 쌓인 이벤트를 여러 요청으로 나누지 않음)
+_TARGET_FLUSH_LATENCY = 0.1  # seconds
+_EWMA_ALPHA = 0.3
+
+# 서버 신호 기반 배치 상한
+# >> 전송 성공 시 2 배 (max_batch_size 까지), 429 / 5xx 등 재시도 가능 실패 시 절반 (하한까지)
+# >> 실제 배치 = max(서버 신호 상한, 지연 모델 배치)
+# >> 상한이 줄어 있어도 목표 지연 안에 비울 수 없을 만큼 쌓이면 지연 모델이 배치를 다시 키움
+_BACKOFF_MIN_BATCH_SIZE = 32
+
+# 동시 전송 배치 수 (HttpTransport 커넥션 풀 maxsize 와 맞춤)
+_SEND_CONCURRENCY = 4
+
+# SIGTERM 수신 후 워커가 잔여 이벤트를 전송하는 최대 시간
+# >> 종료 시 전송은 재시도 없이 1 회, 요청 timeout 도 남은 시간으로 제한
+_SHUTDOWN_FLUSH_TIMEOUT = 10.0  # seconds
+# 전송 완료를 기다리는 중 중지 마감 시간을 확인하는 간격
+_SEND_WAIT_INTERVAL = 0.25  # seconds
+
+# 깨우기 소켓에서 한 번에 읽어 비우는 크기
+_WAKE_READ_SIZE = 4096
+
+
 class BackgroundWorker:
     """
     데몬 스레드 동작 배치 플러시 워커
@@ -38,16 +67,45 @@ class BackgroundWorker:
         self._queue = queue
         self._transport = transport
         self._max_batch_size = max_batch_size
+        self._batch_size = 0  # 지연 모델 배치 (측정값이 없으면 서버 신호 상한만 사용)
+        self._depth_ewma = 0.0
+        self._rtt_ewma = 0.0
+        self._backoff_min_batch = min(_BACKOFF_MIN_BATCH_SIZE, max_batch_size)
+        # 서버 신호 상한은 최대값에서 시작해 429 / 5xx 에서만 줄어듦 (정상일 때 backlog 를 쪼개지 않음)
+        self._effective_batch = max_batch_size
         self._flush_interval = flush_interval
+        self._flush_interval_ns = int(flush_interval * 1e9)  # _run 루프는 정수 ns 로 비교
         self._debug = debug
 
-        self._stop_event = threading.Event()
-        self._flush_event = threading.Event()
+        # 중지 요청 - SIGTERM 핸들러에서도 설정하므로 Event 대신 일반 속성 사용 (락 없음)
+        self._stopping = False
+        # 워커 깨우기용 소켓쌍 (self-pipe)
+        # >> 배치 준비(큐 콜백) / flush() / stop() / SIGTERM 시 1 바이트 send -> 워커가 즉시 깨어남
+        # >> non-blocking send 는 파이썬 락을 잡지 않으므로 시그널 핸들러에서도 안전
+        self._wake_r, self._wake_w = socket.socketpair()
+        self._wake_w.setblocking(False)
+        # flush() 호출마다 완료 Event 를 등록 -> 워커가 락 안에서 목록을 통째로 가져가 처리 후 set
+        self._flush_waiters: List[threading.Event] = []
+        self._flush_lock = threading.Lock()
+        # 중지 시 워커 스레드가 수행할 마지막 플러시 설정 (stop() / SIGTERM 핸들러가 기록)
+        self._flush_on_stop = True
+        self._stop_deadline = 0.0
+        # SIGTERM 기본 동작(SIG_DFL)을 미룬 경우 마지막 플러시 후 다시 보낼 시그널
+        # >> 핸들러는 _redeliver_signal 을 쓴 뒤 _worker_done 을, 워커는 그 반대 순서로 확인
+        # >> (둘 중 최소 한쪽은 상대의 기록을 보게 되어 재전달이 누락되지 않음)
+        self._redeliver_signal: Optional[int] = None
+        self._worker_done = False
         self._lock = threading.Lock()
         self._started = False
 
         self._thread: Optional[threading.Thread] = None
 
+        # 소켓 I/O 중에는 GIL 이 풀리므로 여러 배치를 병렬 전송 (스레드는 첫 submit 시 생성)
+        self._send_pool = ThreadPoolExecutor(
+            max_workers=_SEND_CONCURRENCY,
+            thread_name_prefix="logfix-send",
+        )
+
     def start(self) -> None:
         """
         백그라운드 워커 스레드 시작
@@ -57,6 +115,9 @@ class BackgroundWorker:
                 return
             self._started = True
 
+        # 큐 길이가 임계값에 도달하면 생산자 쪽에서 워커를 깨움 (워커는 size() 를 폴링하지 않음)
+        self._queue.set_batch_ready_callback(self._wake)
+
         self._thread = threading.Thread(
             target=self._run,
             name="logfix-worker",
@@ -79,15 +140,17 @@ class BackgroundWorker:
         if not self._started:
             return
 
-        done_event = threading.Event()
-
-        def _flush_task() -> None:
+        # 워커 스레드가 없으면(fork 이후 등) 호출 스레드에서 직접 처리
+        if self._thread is None or not self._thread.is_alive():
             self._do_flush()
-            done_event.set()
+            return
 
-        t = threading.Thread(target=_flush_task, daemon=True)
-        t.start()
-        done_event.wait(timeout=timeout)
+        # 별도 스레드를 만들지 않고 기존 워커를 깨운 뒤 이 호출 전용 완료 신호를 기다림
+        done = threading.Event()
+        with self._flush_lock:
+            self._flush_waiters.append(done)
+        self._wake()
+        done.wait(timeout=timeout)
 
     def stop(self, flush_remaining: bool = True, timeout: float = 10.0) -> None:
         """
@@ -95,14 +158,26 @@ class BackgroundWorker:
 
         flush_remaining=True 면 잔여 이벤트를 전송합니다.
         """
-        self._stop_event.set()
+        self._flush_on_stop = flush_remaining
+        self._stop_deadline = time.monotonic() + timeout
+        self._stopping = True
+        self._wake()  # 대기 중인 워커를 깨움 -> 워커가 마지막 플러시 후 종료
         if self._thread and self._thread.is_alive():
             self._thread.join(timeout=timeout)
+        elif flush_remaining:
+            # 워커 스레드가 없으면 (미시작 / 이미 종료) 호출 스레드에서 직접 전송
+            self._flush_until(self._stop_deadline)
 
-        if flush_remaining:
-            self._do_flush()
-
+        # >> join 이 timeout 으로 끝났을 수 있으므로 전송 스레드를 기다리지 않음
+        # >> 이후 submit 은 RuntimeError -> 워커 스레드에서 인라인 전송으로 대체됨
+        self._send_pool.shutdown(wait=False)
         self._transport.close()
+        # 아직 살아 있는 워커는 recv 실패(OSError) 후 중지 플래그를 보고 종료
+        for sock in (self._wake_r, self._wake_w):
+            try:
+                sock.close()
+            except OSError:
+                pass
 
 
     # internal
@@ -110,49 +185,231 @@ class BackgroundWorker:
         """
         백그라운드 스레드 메인 루프
         """
+        try:
+            self._loop()
+        finally:
+            # 워커 종료 표시 후 미뤄 둔 SIGTERM 이 있으면 다시 보내 프로세스를 기본 동작으로 종료
+            self._worker_done = True
+            signum = self._redeliver_signal
+            if signum is not None:
+                os.kill(os.getpid(), signum)
+
+    def _loop(self) -> None:
+        # 첫 배치 전에 커넥션을 미리 맺어 둠
+        # >> 전송 스레드 풀에서 수행하므로 워커 루프(첫 플러시 / stop())는 기다리지 않음
+        try:
+            self._send_pool.submit(self._transport.warmup)
+        except RuntimeError:
+            pass  # 이미 stop() 으로 풀이 닫힘
+
+        flush_interval_ns = self._flush_interval_ns
+        last_flush_ns = time.monotonic_ns()
+
+        while not self._stopping:
+            # 배치 준비 / 플러시 요청 / flush_interval 경과 중 먼저 오는 것까지 대기 (폴링 없음)
+            remaining_ns = flush_interval_ns - (time.monotonic_ns() - last_flush_ns)
+            if remaining_ns > 0:
+                self._wait_for_wake(remaining_ns / 1e9)  # 소켓 timeout 은 초 단위
+                if self._stopping:
+                    break
 
+            # 깨어난 이유와 무관하게 플러시 - 깨우기 신호를 비운 뒤 요청을 확인해야 신호를 잃지 않음
+            # >> 이번 플러시가 처리할 flush() 요청만 락 안에서 가져감 (이후 등록분은 다음 루프에서 처리)
+            self._drain_wake()
+            with self._flush_lock:
+                waiters, self._flush_waiters = self._flush_waiters, []
 
-        last_flush_time = time.monotonic()
+            # 큐가 비어 있으면 전송 경로 자체를 건너뜀
+            if not self._queue.is_empty():
+                self._do_flush()
+            last_flush_ns = time.monotonic_ns()
+            for done in waiters:
+                done.set()
 
-        while not self._stop_event.is_set():
-            now = time.monotonic()
-            elapsed = now - last_flush_time
+        if self._debug:
+            logger.debug("LogFix: worker stopping, flushing remaining events...")
 
-            # flush_interval 경과 또는 즉시 플러시 이벤트
-            interval_expired = elapsed >= self._flush_interval
-            flush_requested = self._flush_event.is_set()
-            batch_ready = self._queue.size() >= self._max_batch_size
+        # 중지 요청 - 마감 시간 안에서 잔여 이벤트를 전송하고 종료
+        if self._flush_on_stop:
+            self._flush_until(self._stop_deadline)
 
-            if interval_expired or flush_requested or batch_ready:
-                self._flush_event.clear()
-                self._do_flush()
-                last_flush_time = time.monotonic()
-            else:
-                sleep_duration = min(
-                    0.05,
-                    self._flush_interval - elapsed,
-                )
-                time.sleep(max(0.005, sleep_duration))
+        # 종료 시 남은 flush() 대기자를 모두 풀어줌
+        with self._flush_lock:
+            waiters, self._flush_waiters = self._flush_waiters, []
+        for done in waiters:
+            done.set()
+
+    def _wake(self) -> None:
+        """
+        대기 중인 워커를 깨움 - 락 없이 non-blocking send 1 회만 수행 (시그널 핸들러에서도 호출)
+        """
+        try:
+            self._wake_w.send(b"\0")
+        except OSError:
+            # 버퍼가 가득 참 (깨우기 신호가 이미 쌓여 있음) / 소켓이 닫힘 (stop 이후)
+            pass
+
+    def _wait_for_wake(self, timeout: float) -> None:
+        # 깨우기 신호가 오거나 timeout 이 지날 때까지 대기
+        try:
+            self._wake_r.settimeout(timeout)
+            self._wake_r.recv(_WAKE_READ_SIZE)
+        except socket.timeout:
+            pass
+        except OSError:
+            # 소켓이 닫힘 (stop 이후) -> 일반 대기로 대체
+            time.sleep(timeout)
+
+    def _drain_wake(self) -> None:
+        # 쌓인 깨우기 신호를 모두 비움
+        try:
+            self._wake_r.setblocking(False)
+            while self._wake_r.recv(_WAKE_READ_SIZE):
+                pass
+        except OSError:
+            pass
 
     def _do_flush(self) -> None:
         """
         큐에서 이벤트를 꺼내 배치 전송합니다
         """
+        try:
+            depth = self._queue.size()
+            batches = self._drain_batches(max(self._effective_batch, self._batch_size))
+            if not batches:
+                return
+
+            if self._debug:
+                logger.debug(
+                    "LogFix: flushing %d batches (%d events)",
+                    len(batches),
+                    sum(len(b) for b in batches),
+                )
+
+            results = self._send_batches(batches)
+            for _, rtt in results:
+                self._update_batch_size(depth, rtt)
+            self._update_effective_batch([result for result, _ in results])
+        except Exception as e:
+            if self._debug:
+                logger.debug("LogFix: _do_flush error (silent): %s", e)
+
+    def _flush_until(self, deadline: float) -> None:
+        """
+        종료 시 마감 시간(monotonic)까지 잔여 이벤트를 전송합니다
+
+        >> 배치마다 재시도 없이 1 회, 요청 timeout 은 남은 시간으로 제한
+        >> 전송이 끝나지 않아도 마감 시간이 되면 기다리지 않고 반환 (_run 이 곧바로 시그널 재전달)
+        >> 생산자가 계속 이벤트를 넣어도 마감 시간이 지나면 끝냄
+        """
         try:
             while True:
-                batch = self._queue.drain(self._max_batch_size)
-                if not batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                batches = self._drain_batches(self._max_batch_size)
+                if not batches:
                     break
 
-                if self._debug:
-                    logger.debug("LogFix: flushing batch of %d events", len(batch))
-
-                self._transport.send_batch(batch)
-                if len(batch) < self._max_batch_size:
+                pending: List[Future] = []
+                for batch in batches:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    pending.append(self._submit(batch, remaining))
+                _, not_done = wait(pending, timeout=max(0.0, deadline - time.monotonic()))
+                if not_done or remaining <= 0:
                     break
         except Exception as e:
             if self._debug:
-                logger.debug("LogFix: _do_flush error (silent): %s", e)
+                logger.debug("LogFix: _flush_until error (silent): %s", e)
+
+    def _drain_batches(self, batch_size: int) -> List[List[Event]]:
+        # 덜 찬 배치가 나올 때까지 batch_size 단위로 꺼냄
+        batches: List[List[Event]] = []
+        while True:
+            batch = self._queue.drain(batch_size)
+            if not batch:
+                break
+            batches.append(batch)
+            if len(batch) < batch_size:
+                break
+        return batches
+
+    def _send_batches(
+        self, batches: List[List[Event]]
+    ) -> List[Tuple[TransportResult, float]]:
+        """
+        배치들을 병렬 전송하고 배치별 (전송 결과, 전송 시간) 을 반환합니다
+
+        중지 마감 시간이 지나면 진행 중인 전송(재시도 대기 포함)을 기다리지 않고
+        완료된 결과만 반환 -> 워커가 바로 종료되어 SIGTERM 재전달이 늦어지지 않음
+        """
+        results: List[Tuple[TransportResult, float]] = []
+        pending = [self._submit(batch) for batch in batches]
+        while pending:
+            timeout = _SEND_WAIT_INTERVAL
+            if self._stopping:
+                timeout = self._stop_deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+            done, not_done = wait(pending, timeout=timeout)
+            results.extend(f.result() for f in done)
+            pending = list(not_done)
+        return results
+
+    def _submit(self, batch: List[Event], timeout: Optional[float] = None) -> Future:
+        # 전송 스레드 풀은 워커 스레드만 사용
+        # >> 워커가 전송을 직접 수행하지 않아야 중지 마감 시간에 맞춰 빠져나올 수 있음
+        # >> 다른 스레드(fork 된 자식의 flush() 등 - 자식에는 풀 스레드가 없음)나
+        # >> 풀이 닫힌 경우(atexit 시점 인터프리터 종료 중)는 호출 스레드에서 직접 전송
+        if threading.current_thread() is self._thread:
+            try:
+                return self._send_pool.submit(self._send, batch, timeout)
+            except RuntimeError:
+                pass
+        future: Future = Future()
+        future.set_result(self._send(batch, timeout))
+        return future
+
+    def _send(
+        self, batch: List[Event], timeout: Optional[float] = None
+    ) -> Tuple[TransportResult, float]:
+        started = time.monotonic()
+        try:
+            result = self._transport.send_batch(batch, timeout=timeout)
+        finally:
+            # 전송(성공/포기)이 끝난 이벤트는 풀에 반환
+            for event in batch:
+                event.release()
+        return result, time.monotonic() - started
+
+    def _update_batch_size(self, depth: int, rtt: float) -> None:
+        """
+        큐 깊이와 전송 RTT 를 반영해 지연 모델 배치를 계산합니다
+
+        쌓인 이벤트를 목표 지연 안에 비우는 데 필요한 최소 배치이므로 하한으로만 사용
+        >> RTT 가 목표 지연보다 짧으면 큐 깊이보다 작아지므로 그대로 쓰면 배치를 쪼개게 됨
+        """
+        if self._rtt_ewma == 0.0:
+            # 첫 측정값으로 시드
+            self._depth_ewma, self._rtt_ewma = float(depth), rtt
+        else:
+            self._depth_ewma += _EWMA_ALPHA * (depth - self._depth_ewma)
+            self._rtt_ewma += _EWMA_ALPHA * (rtt - self._rtt_ewma)
+        needed = int(self._depth_ewma * self._rtt_ewma / _TARGET_FLUSH_LATENCY)
+        self._batch_size = min(needed, self._max_batch_size)
+
+    def _update_effective_batch(self, results: List[TransportResult]) -> None:
+        """
+        서버 응답을 반영해 배치 상한을 조정합니다 (플러시 1 회당 1 단계)
+
+        재시도 가능 실패(429 / 5xx / 네트워크)가 하나라도 있으면 절반, 모두 성공이면 2 배
+        """
+        if any(not r.success and r.retryable for r in results):
+            self._effective_batch = max(self._backoff_min_batch, self._effective_batch // 2)
+        elif all(r.success for r in results):
+            self._effective_batch = min(self._max_batch_size, self._effective_batch * 2)
 
     def _shutdown(self) -> None:
         """
@@ -164,19 +421,36 @@ class BackgroundWorker:
 
     def _register_signal_handlers(self) -> None:
         """
-        SIGTERM 수신 시 플러시 후 정상 종료
+        SIGTERM 수신 시 워커에 중지를 알려 잔여 이벤트를 전송하게 함
         기존 시그널 핸들러가 있으면 체이닝
+
+        핸들러는 플래그 설정과 non-blocking 깨우기만 수행 (네트워크 I/O / 락 / 스레드 생성 없음)
+        >> 기존 핸들러가 파이썬 함수면 워커를 깨워 플러시만 시키고 체이닝
+        >> (gunicorn / celery 등은 SIGTERM 후에도 처리를 이어가므로 워커를 멈추지 않음 - 최종 종료는 atexit -> stop())
+        >> 기존 핸들러가 SIG_DFL 이면 기본 동작으로 되돌리고, 워커가 마지막 플러시 후 시그널을 재전달
+        >> 기존 핸들러가 SIG_IGN 이면 앱이 SIGTERM 을 무시하므로 핸들러를 설치하지 않음
         """
         try:
             original_sigterm = signal.getsignal(signal.SIGTERM)
+            if original_sigterm == signal.SIG_IGN:
+                return
 
             def _sigterm_handler(signum, frame):
-                if self._debug:
-                    logger.debug("LogFix: SIGTERM received, flushing...")
-                self._do_flush()
                 if callable(original_sigterm):
+                    self._wake()
                     original_sigterm(signum, frame)
+                    return
+
+                # SIG_DFL (또는 파이썬 밖에서 설치된 핸들러)
+                self._stop_deadline = time.monotonic() + _SHUTDOWN_FLUSH_TIMEOUT
+                signal.signal(signum, signal.SIG_DFL)
+                self._redeliver_signal = signum
+                self._stopping = True
+                self._wake()
+                if self._worker_done or self._thread is None:
+                    # 워커가 이미 종료됨 -> 바로 기본 동작 수행
+                    os.kill(os.getpid(), signum)
 
             signal.signal(signal.SIGTERM, _sigterm_handler)
         except (ValueError, OSError):
-            pass
\ No newline at end of file
+            pass
@@ -14,7 +14,7 @@ setup(
     packages=find_packages(exclude=["tests*"]),
     python_requires=">=3.8",
     install_requires=[
-        "requests>=2.20.0",
+        "urllib3>=1.26",
     ],
     extras_require={
         "dev": [
@@ -24,6 +24,7 @@ setup(
         "flask": ["flask>=2.0"],
         "django": ["django>=3.2"],
         "fastapi": ["fastapi>=0.95", "starlette>=0.27"],
+        "orjson": ["orjson>=3.6"],
     },
     classifiers=[
         "Development Status :: 5 - Production/Stable",
@@ -0,0 +1,11 @@
+import pytest
+
+from logfix.event import Event
+
+
+@pytest.fixture(autouse=True)
+def _empty_event_pool():
+    # Event free-list 는 클래스 단위로 공유되므로 테스트마다 비움
+    Event._pool.clear()
+    yield
+    Event._pool.clear()
@@ -0,0 +1,55 @@
+import pytest
+
+pytest.importorskip("urllib3")
+
+from logfix.client import LogfixClient  # noqa: E402
+from logfix.config import Config  # noqa: E402
+from logfix.event import Level  # noqa: E402
+from logfix.worker import BackgroundWorker  # noqa: E402
+
+
+@pytest.fixture
+def make_client(monkeypatch):
+    # 워커 스레드 / 시그널 핸들러 없이 큐에 쌓이는 이벤트만 확인
+    monkeypatch.setattr(BackgroundWorker, "start", lambda self: None)
+    clients = []
+
+    def factory(**kwargs):
+        client = LogfixClient(Config(api_key="key", endpoint="http://127.0.0.1:9", **kwargs))
+        clients.append(client)
+        return client
+
+    yield factory
+    for client in clients:
+        client._worker.stop(flush_remaining=False, timeout=0)
+
+
+# min_level
+def test_min_level_drops_lower_levels_before_building_event(make_client, monkeypatch):
+    client = make_client(min_level=Level.WARNING)
+    built = []
+    build_event = client._build_event
+    monkeypatch.setattr(client, "_build_event", lambda **kw: built.append(kw) or build_event(**kw))
+
+    assert client.capture_message("debug", level=Level.DEBUG) is None
+    assert client.capture_message("info", level=Level.INFO) is None
+    assert client.capture_error(ValueError("low"), level=Level.INFO) is None
+    assert client._queue.is_empty()
+
+    assert client.capture_message("warning", level=Level.WARNING) is not None
+    assert client.capture_error(ValueError("high")) is not None
+    assert client._queue.size() == 2
+    assert [kw["level"] for kw in built] == [Level.WARNING, Level.ERROR]
+
+
+def test_default_min_level_keeps_everything(make_client):
+    client = make_client()
+    for level in Level:
+        assert client.capture_message(level.value, level=level) is not None
+    assert client._queue.size() == len(Level)
+
+
+def test_invalid_level_is_swallowed(make_client):
+    client = make_client()
+    assert client.capture_message("x", level="warning") is None
+    assert client._queue.is_empty()
@@ -0,0 +1,40 @@
+import io
+
+import pytest
+
+from logfix import context
+
+
+def _os_release(monkeypatch, content):
+    def fake_open(path, *args, **kwargs):
+        assert path == "/etc/os-release"
+        if content is None:
+            raise FileNotFoundError(path)
+        return io.StringIO(content)
+
+    # 모듈 전역 open 이 builtins 보다 먼저 조회됨
+    monkeypatch.setattr(context, "open", fake_open, raising=False)
+
+
+# /etc/os-release 파싱
+@pytest.mark.parametrize(
+    "content, expected",
+    [
+        ('NAME="Ubuntu"\nID=ubuntu\nID_LIKE=debian\nVERSION_ID="22.04"\n', "linux-ubuntu-22.04"),
+        ("ID='alpine'\nVERSION_ID=3.19.1\n", "linux-alpine-3.19.1"),
+        ('ID="Fedora"\nVERSION_ID=39', "linux-fedora-39"),
+        ("ID=arch\n", "linux-arch"),
+        ('VERSION_ID="12"\n', "linux-linux-12"),
+        ("", "linux-linux"),
+        # ID_LIKE / VERSION 같은 접두 키와 들여쓴 줄은 무시
+        ('ID_LIKE=debian\n  ID=fake\nVERSION="22.04 LTS"\nID=debian\n', "linux-debian"),
+    ],
+)
+def test_parse_os_release(monkeypatch, content, expected):
+    _os_release(monkeypatch, content)
+    assert context._parse_os_release() == expected
+
+
+def test_parse_os_release_missing_file(monkeypatch):
+    _os_release(monkeypatch, None)
+    assert context._parse_os_release() is None
@@ -0,0 +1,172 @@
+import re
+
+import pytest
+
+from logfix import event as event_module
+from logfix.client import LogfixClient
+from logfix.event import _EVENT_POOL_SIZE, Event, Level, _fast_uuid4
+
+
+# UUID v4
+_UUID4 = re.compile(r"^[0-9a-f]{8}-[0-9a-f]{4}-4[0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$")
+
+
+def test_fast_uuid4_sets_version_and_variant_bits():
+    # 풀 경계(256 개)를 여러 번 넘도록 생성
+    ids = [_fast_uuid4() for _ in range(1000)]
+    assert all(_UUID4.match(i) for i in ids)
+    assert len(set(ids)) == len(ids)
+
+
+def test_after_fork_hook_replaces_held_lock():
+    # fork 시점에 다른 스레드가 쥐고 있던 락을 흉내냄
+    held = event_module._rand_lock
+    held.acquire()
+    try:
+        event_module._reset_rand_pool()
+        assert event_module._rand_lock is not held
+        assert event_module._rand_idx == event_module._RAND_POOL_SIZE
+        assert _UUID4.match(_fast_uuid4())  # 새 락으로 바로 생성 (교착 없음)
+    finally:
+        held.release()
+
+
+# shape 별 직렬화 함수
+def _baseline_to_dict(e):
+    # 특화 직렬화 도입 전 Event.to_dict 와 동일한 payload
+    payload = {
+        "id": e.event_id,
+        "timestamp": e.timestamp,
+        "level": e.level.value.upper(),
+        "message": e.message,
+        "app_version": e.app_version,
+    }
+    if e.os_info:
+        payload["os_version"] = e.os_info
+    if e.runtime_version:
+        payload["platform"] = e.runtime_version
+    if e.stack_trace:
+        payload["stacktrace"] = e.stack_trace
+    if e.tags:
+        payload["tags"] = e.tags
+    if e.extra:
+        payload["extra"] = e.extra
+    if e.http_method is not None:
+        payload["http"] = {
+            "method": e.http_method,
+            "url": e.http_url,
+            "status_code": e.http_status_code,
+        }
+    return payload
+
+
+_OPTIONAL_VALUES = (
+    {"os_info": "linux-ubuntu-22.04"},
+    {"runtime_version": "python3.11.4"},
+    {"stack_trace": "Traceback ..."},
+    {"tags": {"env": "prod"}},
+    {"extra": {"user_id": 42}},
+    {"http_method": "GET", "http_url": "http://h/p", "http_status_code": 500},
+)
+
+
+@pytest.mark.parametrize("shape", range(1 << len(_OPTIONAL_VALUES)))
+@pytest.mark.parametrize("level", list(Level))
+def test_serializer_matches_baseline_for_every_shape(shape, level):
+    kwargs = {}
+    for bit, values in enumerate(_OPTIONAL_VALUES):
+        if shape & (1 << bit):
+            kwargs.update(values)
+    event = Event("hello", level, app_version="1.2.3", **kwargs)
+
+    # 키 순서까지 동일해야 함 (JSON 출력이 같아야 하므로)
+    assert list(event.to_dict().items()) == list(_baseline_to_dict(event).items())
+
+
+def test_serializer_is_compiled_once_per_shape():
+    Event("a", os_info="x").to_dict()
+    serializer = event_module._SERIALIZERS[1]
+    Event("b", os_info="y").to_dict()
+    assert event_module._SERIALIZERS[1] is serializer
+
+
+def test_http_shape_is_keyed_on_method_only():
+    event = Event("a", http_method="POST")
+    assert event.to_dict()["http"] == {"method": "POST", "url": None, "status_code": None}
+
+
+# 지연 예외 메시지
+class _CountingError(Exception):
+    def __init__(self):
+        super().__init__()
+        self.str_calls = 0
+
+    def __str__(self):
+        self.str_calls += 1
+        return "counted"
+
+
+class _UnprintableError(Exception):
+    def __str__(self):
+        raise RuntimeError("no str")
+
+
+def test_exception_message_is_rendered_at_serialization():
+    exc = _CountingError()
+    event = Event(LogfixClient._format_exception(exc))
+    assert exc.str_calls == 0  # 캡처 시점에는 str(exc) 를 호출하지 않음
+
+    assert event.to_dict()["message"] == "_CountingError: counted"
+    assert event.message == "_CountingError: counted"  # 렌더링 결과를 저장 (재직렬화 시 재사용)
+    event.to_dict()
+    assert exc.str_calls == 1
+
+
+def test_unprintable_exception_still_serializes():
+    event = Event(("_UnprintableError", _UnprintableError()))
+    assert event.to_dict()["message"] == "_UnprintableError: <unprintable exception>"
+
+
+# free-list 풀
+def test_release_clears_references_and_returns_to_pool():
+    event = Event("boom", Level.ERROR, tags={"k": "v"}, extra={"x": 1})
+    event.release()
+
+    assert event.message == ""
+    assert event.stack_trace == ""
+    assert event.tags is None
+    assert event.extra is None
+    assert list(Event._pool) == [event]
+
+
+def test_acquire_reuses_released_event_with_fresh_fields():
+    first = Event("old", Level.ERROR, tags={"k": "v"})
+    old_id = first.event_id
+    first.release()
+
+    second = Event.acquire("new", Level.INFO)
+
+    assert second is first
+    assert not Event._pool
+    assert second.message == "new"
+    assert second.level is Level.INFO
+    assert second.tags == {}
+    assert second.extra == {}
+    assert second.event_id != old_id
+
+
+def test_acquire_keeps_explicit_event_id():
+    Event("old").release()
+    assert Event.acquire("new", event_id="fixed-id").event_id == "fixed-id"
+
+
+def test_acquire_without_pooled_event_builds_new_one():
+    event = Event.acquire("hello", Level.WARNING)
+    assert isinstance(event, Event)
+    assert event.to_dict()["level"] == "WARNING"
+
+
+def test_pool_is_bounded():
+    for _ in range(_EVENT_POOL_SIZE + 10):
+        Event("x").release()
+    assert len(Event._pool) == _EVENT_POOL_SIZE
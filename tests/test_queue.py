@@ -0,0 +1,142 @@
+from collections import deque
+
+import pytest
+
+from logfix.config import OverflowPolicy
+from logfix.event import Event
+from logfix.queue import EventQueue
+
+
+def _messages(events):
+    return [e.message for e in events]
+
+
+def _events(*messages):
+    return [Event(m) for m in messages]
+
+
+# dropped_count
+@pytest.mark.parametrize("policy", [OverflowPolicy.DROP_NEWEST, OverflowPolicy.DROP_OLDEST])
+def test_dropped_count_is_stable_across_reads(policy):
+    queue = EventQueue(1, policy)
+    assert queue.dropped_count == 0
+    assert queue.dropped_count == 0
+
+    for event in _events("a", "b", "c"):
+        queue.put(event)
+    assert queue.dropped_count == 2
+    assert queue.dropped_count == 2
+
+    queue.put(Event("d"))
+    assert queue.dropped_count == 3
+
+
+def test_drop_newest_rejects_when_full():
+    queue = EventQueue(2, OverflowPolicy.DROP_NEWEST)
+    results = [queue.put(e) for e in _events("a", "b", "c")]
+    assert results == [True, True, False]
+    assert _messages(queue.drain(10)) == ["a", "b"]
+
+
+# batch-ready callback
+@pytest.mark.parametrize("policy", list(OverflowPolicy))
+def test_batch_ready_callback_is_edge_triggered(policy):
+    calls = []
+    queue = EventQueue(10, policy, batch_threshold=3, batch_ready_callback=lambda: calls.append(1))
+
+    for event in _events("a", "b"):
+        queue.put(event)
+    assert calls == []
+
+    for event in _events("c", "d", "e"):
+        queue.put(event)
+    assert len(calls) == 1  # 임계값 도달 시 1 회만
+
+    queue.drain(10)
+    for event in _events("f", "g", "h"):
+        queue.put(event)
+    assert len(calls) == 2  # drain 이후 다시 도달하면 재호출
+
+
+def test_batch_ready_callback_can_be_set_later():
+    calls = []
+    queue = EventQueue(10, OverflowPolicy.DROP_NEWEST, batch_threshold=1)
+    queue.set_batch_ready_callback(lambda: calls.append(1))
+    queue.put_lazy(lambda: Event("x"))
+    assert calls == [1]
+# ring buffer (DROP_OLDEST / BLOCK)
+def test_drop_oldest_overwrites_oldest_and_counts_drops():
+    queue = EventQueue(3, OverflowPolicy.DROP_OLDEST)
+    for event in _events("a", "b", "c", "d", "e"):
+        assert queue.put(event) is True
+
+    assert queue.size() == 3
+    assert queue.dropped_count == 2
+    assert _messages(queue.drain(10)) == ["c", "d", "e"]
+    assert queue.is_empty()
+
+
+@pytest.mark.parametrize("policy", [OverflowPolicy.DROP_OLDEST, OverflowPolicy.BLOCK])
+def test_ring_buffer_preserves_order_across_wraparound(policy):
+    queue = EventQueue(4, policy)
+    expected = deque()
+    counter = 0
+
+    # 부분 drain 과 삽입을 반복해 head / tail 이 여러 번 끝을 넘어가게 함
+    for take in (3, 1, 2, 4, 2):
+        for _ in range(take):
+            message = str(counter)
+            counter += 1
+            queue.put(Event(message))
+            expected.append(message)
+        drained = _messages(queue.drain(2))
+        assert drained == [expected.popleft() for _ in range(len(drained))]
+        assert queue.size() == len(expected)
+
+    assert _messages(queue.drain_all()) == list(expected)
+    assert queue.dropped_count == 0
+
+
+def test_drain_wraps_around_end_of_ring():
+    queue = EventQueue(4, OverflowPolicy.DROP_OLDEST)
+    for event in _events("a", "b", "c"):
+        queue.put(event)
+    assert _messages(queue.drain(2)) == ["a", "b"]
+    for event in _events("d", "e", "f"):
+        queue.put(event)
+
+    # head=2 에서 시작해 버퍼 끝을 넘어 0, 1 슬롯까지 읽음
+    assert _messages(queue.drain(4)) == ["c", "d", "e", "f"]
+    assert queue._buf == [None] * 4
+
+
+# put_lazy
+def test_put_lazy_skips_factory_when_drop_newest_is_full():
+    queue = EventQueue(1, OverflowPolicy.DROP_NEWEST)
+    calls = []
+
+    def factory():
+        calls.append(1)
+        return Event("x")
+
+    assert queue.put_lazy(factory) is True
+    assert queue.put_lazy(factory) is False
+    assert len(calls) == 1
+    assert queue.dropped_count == 1
+
+
+@pytest.mark.parametrize("policy", [OverflowPolicy.DROP_OLDEST, OverflowPolicy.BLOCK])
+def test_put_lazy_builds_event_for_other_policies(policy):
+    queue = EventQueue(2, policy)
+    assert queue.put_lazy(lambda: Event("x")) is True
+    assert _messages(queue.drain(1)) == ["x"]
+
+
+def test_put_lazy_swallows_factory_errors():
+    queue = EventQueue(2, OverflowPolicy.DROP_NEWEST)
+
+    def factory():
+        raise RuntimeError("boom")
+
+    assert queue.put_lazy(factory) is False
+    assert queue.is_empty()
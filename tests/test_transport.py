@@ -0,0 +1,119 @@
+import time
+from email.utils import formatdate
+
+import pytest
+
+urllib3 = pytest.importorskip("urllib3")
+
+from logfix.event import Event  # noqa: E402
+from logfix.transport import _DEFAULT_TIMEOUT, HttpTransport, _LogFixRetry  # noqa: E402
+
+
+def _response(status, headers=None):
+    return urllib3.HTTPResponse(status=status, headers=headers or {})
+
+
+@pytest.fixture
+def transport():
+    t = HttpTransport("key", "http://127.0.0.1:9", max_retries=3, backoff_base=1.0, backoff_cap=4.0)
+    yield t
+    t.close()
+
+
+def _retry(transport):
+    return transport._pool.connection_pool_kw["retries"]
+
+
+# 난수원
+def test_pool_uses_logfix_retry_with_transport_rng(transport):
+    retry = _retry(transport)
+    assert isinstance(retry, _LogFixRetry)
+    assert retry.total == 3
+    assert retry._rng is transport._rng
+    assert retry.backoff_cap == 4.0
+
+
+def test_new_keeps_rng_and_cap(transport):
+    retry = _retry(transport).increment(method="POST", url="/v1/ingest", response=_response(503))
+    assert retry._rng is transport._rng
+    assert retry.backoff_cap == 4.0
+    assert len(retry.history) == 1
+
+
+def test_transports_do_not_share_rng():
+    a = HttpTransport("key", "http://127.0.0.1:9")
+    b = HttpTransport("key", "http://127.0.0.1:9")
+    assert _retry(a)._rng is not _retry(b)._rng
+
+
+# 429
+@pytest.mark.parametrize(
+    "headers, expected",
+    [
+        ({"Retry-After": "3"}, 3.0),
+        ({"Retry-After": "0"}, 1.0),  # 하한 1초
+        ({"Retry-After": "86400"}, 60.0),  # 상한 60초
+        ({}, 5.0),  # 헤더 없음 -> 기본값
+    ],
+)
+def test_429_retry_after_seconds(transport, headers, expected):
+    assert _retry(transport).get_retry_after(_response(429, headers)) == expected
+
+
+def test_429_retry_after_http_date(transport):
+    headers = {"Retry-After": formatdate(time.time() + 10, usegmt=True)}
+    assert 8.0 <= _retry(transport).get_retry_after(_response(429, headers)) <= 10.0
+
+
+def test_429_falls_back_to_rate_limit_reset(transport):
+    headers = {"X-RateLimit-Reset": str(time.time() + 10)}
+    assert 9.0 <= _retry(transport).get_retry_after(_response(429, headers)) <= 10.0
+
+
+# 429 외 응답 코드
+def test_503_retry_after_is_clamped(transport):
+    assert _retry(transport).get_retry_after(_response(503, {"Retry-After": "86400"})) == 60.0
+
+
+def test_503_without_or_with_invalid_retry_after(transport):
+    retry = _retry(transport)
+    assert retry.get_retry_after(_response(503)) is None
+    assert retry.get_retry_after(_response(503, {"Retry-After": "soon"})) is None
+
+
+# backoff
+def test_backoff_is_zero_without_history(transport):
+    assert _retry(transport).get_backoff_time() == 0
+
+
+def test_backoff_is_full_jitter_bounded_by_cap(transport):
+    retry = _retry(transport)
+    # 실패 n 회 후 대기 범위: [0, min(cap=4, base=1 * 2^(n-1))]
+    for bound in (1.0, 2.0, 4.0):
+        retry = retry.increment(method="POST", url="/v1/ingest", response=_response(500))
+        samples = [retry.get_backoff_time() for _ in range(200)]
+        assert all(0 <= s <= bound for s in samples)
+        assert max(samples) > bound / 2  # 범위 전체에서 고르게 뽑힘
+
+
+# 종료 시 전송 (timeout 지정)
+class _Recorder:
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, method, url, **kwargs):
+        self.calls.append(kwargs)
+        return _response(200)
+
+
+def test_send_batch_with_timeout_disables_retries(transport):
+    recorder = transport._urlopen = _Recorder()
+
+    assert transport.send_batch([Event("a")], timeout=1.5).success
+    assert transport.send_batch([Event("b")]).success
+
+    once, default = recorder.calls
+    assert once["retries"] is False
+    assert once["timeout"] == 1.5
+    assert default["retries"] is None  # 풀의 _LogFixRetry 사용
+    assert default["timeout"] == _DEFAULT_TIMEOUT
@@ -0,0 +1,375 @@
+import os
+import signal
+import subprocess
+import sys
+import textwrap
+import threading
+import time
+
+import pytest
+
+from logfix.config import OverflowPolicy
+from logfix.event import Event
+from logfix.queue import EventQueue
+from logfix.transport import TransportResult
+from logfix.worker import BackgroundWorker
+
+
+class FakeTransport:
+    """전송한 메시지 / 배치 크기 / 요청 timeout / 최대 동시 전송 수를 기록하는 가짜 전송기"""
+
+    def __init__(self, delay=0.0, result=None):
+        self.sent = []
+        self.batch_sizes = []
+        self.timeouts = []
+        self.delay = delay
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.result = result or TransportResult(success=True, status_code=200)
+        self._lock = threading.Lock()
+
+    def warmup(self):
+        pass
+
+    def send_batch(self, events, timeout=None):
+        with self._lock:
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        if self.delay:
+            time.sleep(self.delay)
+        with self._lock:
+            self.in_flight -= 1
+            self.sent.extend(e.message for e in events)
+            self.batch_sizes.append(len(events))
+            self.timeouts.append(timeout)
+        return self.result
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def make_worker(monkeypatch):
+    # 테스트 프로세스의 SIGTERM 핸들러를 바꾸지 않도록 등록을 생략
+    monkeypatch.setattr(BackgroundWorker, "_register_signal_handlers", lambda self: None)
+    workers = []
+
+    def factory(max_batch_size=50, flush_interval=60.0, transport=None, start=True):
+        queue = EventQueue(1000, OverflowPolicy.DROP_NEWEST, batch_threshold=max_batch_size)
+        transport = transport or FakeTransport()
+        worker = BackgroundWorker(queue, transport, max_batch_size, flush_interval)
+        if start:
+            worker.start()
+        workers.append(worker)
+        return worker, queue, transport
+
+    yield factory
+    for worker in workers:
+        worker.stop(flush_remaining=False, timeout=2.0)
+
+
+def _put(queue, count, prefix=""):
+    for i in range(count):
+        queue.put(Event(f"{prefix}{i}"))
+
+
+def _wait_until(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return predicate()
+
+
+# 적응형 배치 크기
+def test_backlog_up_to_max_batch_size_is_one_request(make_worker):
+    # 시작 스레드 없이 _do_flush 를 직접 호출 (호출 스레드에서 전송)
+    worker, queue, transport = make_worker(max_batch_size=50, start=False)
+
+    # RTT 가 목표 지연보다 훨씬 짧아도 쌓인 이벤트를 쪼개지 않음
+    for _ in range(20):
+        worker._update_batch_size(50, 0.005)
+    _put(queue, 50)
+    worker._do_flush()
+
+    assert transport.batch_sizes == [50]
+
+
+def test_large_backlog_is_sent_in_max_size_batches(make_worker):
+    worker, queue, transport = make_worker(max_batch_size=50, start=False)
+    worker._update_batch_size(1000, 0.01)
+    _put(queue, 1000)
+    worker._do_flush()
+
+    assert transport.batch_sizes == [50] * 20
+    assert len(transport.sent) == 1000
+
+
+def test_latency_model_only_raises_the_drain_size(make_worker):
+    worker, queue, transport = make_worker(max_batch_size=100, start=False)
+    worker._effective_batch = 32  # 서버 신호로 줄어든 상한
+
+    # 목표 지연 안에 비울 수 있으면 상한 그대로
+    worker._update_batch_size(40, 0.01)
+    _put(queue, 64)
+    worker._do_flush()
+    assert transport.batch_sizes == [32, 32]
+
+    # 비울 수 없을 만큼 쌓이면 max_batch_size 까지 키움
+    transport.batch_sizes.clear()
+    for _ in range(5):
+        worker._update_batch_size(500, 0.5)
+    worker._effective_batch = 32  # 직전 성공으로 2 배가 된 상한을 되돌림
+    _put(queue, 200)
+    worker._do_flush()
+    assert transport.batch_sizes == [100, 100]
+
+
+# 서버 신호 기반 배치 상한
+_OK = TransportResult(success=True, status_code=200)
+_RATE_LIMITED = TransportResult(success=False, status_code=429, retryable=True)
+_BAD_REQUEST = TransportResult(success=False, status_code=400, retryable=False)
+
+
+def test_effective_batch_starts_at_max_and_halves_on_retryable_failure(make_worker):
+    worker, _, _ = make_worker(max_batch_size=200, start=False)
+    assert worker._effective_batch == 200
+
+    worker._update_effective_batch([_OK, _RATE_LIMITED])
+    assert worker._effective_batch == 100
+    for _ in range(5):
+        worker._update_effective_batch([_RATE_LIMITED])
+    assert worker._effective_batch == 32  # 하한
+
+    worker._update_effective_batch([_OK, _OK])
+    assert worker._effective_batch == 64
+    for _ in range(5):
+        worker._update_effective_batch([_OK])
+    assert worker._effective_batch == 200  # 상한
+
+
+def test_effective_batch_ignores_non_retryable_failures(make_worker):
+    worker, _, _ = make_worker(max_batch_size=200, start=False)
+    worker._effective_batch = 64
+    worker._update_effective_batch([_OK, _BAD_REQUEST])
+    assert worker._effective_batch == 64
+
+
+def test_rate_limited_flush_shrinks_next_batches(make_worker):
+    transport = FakeTransport(result=_RATE_LIMITED)
+    worker, queue, _ = make_worker(max_batch_size=100, transport=transport, start=False)
+    _put(queue, 100)
+    worker._do_flush()
+    _put(queue, 100)
+    worker._do_flush()
+
+    assert transport.batch_sizes == [100, 50, 50]
+
+
+# 병렬 전송
+def test_flush_waits_for_parallel_batches(make_worker):
+    worker, queue, transport = make_worker(max_batch_size=50, transport=FakeTransport(delay=0.05))
+    _put(queue, 400)
+
+    worker.flush(timeout=5.0)
+
+    # 워커가 먼저 꺼내 전송 중인 배치까지 끝난 뒤 반환
+    assert len(transport.sent) == 400
+    assert transport.peak_in_flight > 1
+
+
+# flush() 완료 신호
+def test_flush_sends_pending_events_before_returning(make_worker):
+    worker, queue, transport = make_worker()
+    _put(queue, 5)
+
+    started = time.monotonic()
+    worker.flush(timeout=5.0)
+
+    assert time.monotonic() - started < 1.0
+    assert transport.sent == ["0", "1", "2", "3", "4"]
+
+
+def test_concurrent_flush_calls_all_complete(make_worker):
+    worker, queue, transport = make_worker()
+    durations = []
+
+    def producer(prefix):
+        for i in range(50):
+            queue.put(Event(f"{prefix}-{i}"))
+            started = time.monotonic()
+            worker.flush(timeout=5.0)
+            durations.append(time.monotonic() - started)
+
+    threads = [threading.Thread(target=producer, args=(n,)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # 요청이 유실되면 해당 flush() 는 timeout(5초) 까지 대기
+    assert max(durations) < 1.0
+    assert len(transport.sent) == 200
+
+
+def test_flush_without_worker_thread_sends_inline(make_worker):
+    worker, queue, transport = make_worker()
+    # fork 된 자식처럼 시작은 되었지만 워커 스레드가 없는 상태
+    worker.stop(flush_remaining=False, timeout=2.0)
+    _put(queue, 3)
+
+    worker.flush(timeout=1.0)
+
+    assert transport.sent == ["0", "1", "2"]
+
+
+# 중지 / SIGTERM
+class _HangingTransport(FakeTransport):
+    """release 가 set 될 때까지 전송이 끝나지 않는 전송기"""
+
+    def __init__(self):
+        super().__init__()
+        self.release = threading.Event()
+
+    def send_batch(self, events, timeout=None):
+        self.release.wait(5.0)
+        return super().send_batch(events, timeout)
+
+
+def test_stop_flushes_remaining_events_once_without_retries(make_worker):
+    worker, queue, transport = make_worker()
+    _put(queue, 3)
+
+    worker.stop(flush_remaining=True, timeout=2.0)
+
+    assert transport.sent == ["0", "1", "2"]
+    # 마지막 플러시는 재시도 없이 남은 시간 안에서 1 회 전송
+    assert all(t is not None and 0 < t <= 2.0 for t in transport.timeouts)
+
+
+def test_stop_returns_at_deadline_while_send_is_in_flight(make_worker):
+    transport = _HangingTransport()
+    worker, queue, _ = make_worker(max_batch_size=10, transport=transport)
+    try:
+        _put(queue, 10)  # 임계값 도달 -> 워커가 전송을 시작하고 멈춤
+        time.sleep(0.1)
+
+        started = time.monotonic()
+        worker.stop(flush_remaining=True, timeout=0.3)
+
+        assert time.monotonic() - started < 1.0
+        worker._thread.join(0.5)  # 마감 시각과 join timeout 이 같으므로 약간의 여유
+        assert not worker._thread.is_alive()
+    finally:
+        transport.release.set()
+
+
+_CHILD_PRELUDE = """
+import os, signal, sys, time
+from logfix import worker as worker_module
+from logfix.config import OverflowPolicy
+from logfix.event import Event
+from logfix.queue import EventQueue
+from logfix.transport import TransportResult
+from logfix.worker import BackgroundWorker
+
+class Transport:
+    delay = 0.01
+    def warmup(self):
+        pass
+    def send_batch(self, events, timeout=None):
+        time.sleep(self.delay)
+        os.write(1, b"sent %d\\n" % len(events))  # 전송 스레드끼리 출력이 섞이지 않도록 write 1 회
+        return TransportResult(success=True, status_code=200)
+    def close(self):
+        pass
+
+queue = EventQueue(1000, OverflowPolicy.BLOCK, batch_threshold=100)
+transport = Transport()
+worker = BackgroundWorker(queue, transport, 100, 60.0)
+"""
+
+
+def _run_child(body, timeout=10.0):
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(p for p in sys.path if p))
+    code = _CHILD_PRELUDE + textwrap.dedent(body)
+    return subprocess.run(
+        [sys.executable, "-c", code], env=env, capture_output=True, text=True, timeout=timeout
+    )
+
+
+def _sent(stdout):
+    return sum(int(line.split()[1]) for line in stdout.splitlines() if line.startswith("sent "))
+
+
+posix_only = pytest.mark.skipif(sys.platform == "win32", reason="POSIX signal semantics")
+
+
+@posix_only
+def test_sigterm_with_default_handler_flushes_then_terminates():
+    result = _run_child(
+        """
+        worker.start()
+        for i in range(150):
+            queue.put(Event(str(i)))
+        os.kill(os.getpid(), signal.SIGTERM)
+        time.sleep(5)
+        print("still alive", flush=True)
+        """
+    )
+    assert result.returncode == -signal.SIGTERM
+    assert _sent(result.stdout) == 150
+    assert "still alive" not in result.stdout
+
+
+@posix_only
+def test_sigterm_redelivery_is_not_delayed_by_in_flight_send():
+    started = time.monotonic()
+    result = _run_child(
+        """
+        worker_module._SHUTDOWN_FLUSH_TIMEOUT = 0.5
+        transport.delay = 30.0  # 재시도 / Retry-After 대기 중인 전송
+        worker.start()
+        for i in range(100):
+            queue.put(Event(str(i)))
+        time.sleep(0.2)
+        os.kill(os.getpid(), signal.SIGTERM)
+        time.sleep(30)
+        """
+    )
+    assert result.returncode == -signal.SIGTERM
+    assert time.monotonic() - started < 8.0
+
+
+@posix_only
+def test_sigterm_with_python_handler_keeps_worker_running():
+    result = _run_child(
+        """
+        received = []
+        signal.signal(signal.SIGTERM, lambda signum, frame: received.append(signum))
+        worker.start()
+        for i in range(50):
+            queue.put(Event(str(i)))
+        os.kill(os.getpid(), signal.SIGTERM)
+        time.sleep(0.3)
+        print("chained", received == [signal.SIGTERM], flush=True)
+        print("alive", worker._thread.is_alive(), flush=True)
+        # BLOCK 정책 - 워커가 멈췄다면 여기서 생산자가 멈춤
+        for i in range(3000):
+            queue.put(Event(str(i)))
+        worker.stop()
+        """
+    )
+    assert result.returncode == 0, result.stderr
+    assert "chained True" in result.stdout
+    assert "alive True" in result.stdout
+    assert _sent(result.stdout) == 3050
+
+
+# 배치 준비 콜백
+def test_batch_threshold_wakes_worker_before_interval(make_worker):
+    _, queue, transport = make_worker(max_batch_size=10, flush_interval=60.0)
+    _put(queue, 10)
+
+    assert _wait_until(lambda: len(transport.sent) == 10)